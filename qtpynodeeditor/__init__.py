@@ -21,6 +21,7 @@ from .node_state import NodeState
 from .port import Port, opposite_port
 from .style import (ConnectionStyle, FlowViewStyle, NodeStyle, Style,
                     StyleCollection)
+from .util import jit
 from .version import __version__  # noqa: F401
 
 __all__ = [
@@ -60,5 +61,6 @@ __all__ = [
     'PortsOfSameTypeError',
     'Style',
     'StyleCollection',
+    'jit',
     'opposite_port',
 ]
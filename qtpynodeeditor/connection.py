@@ -1,3 +1,4 @@
+import sys
 import typing
 import uuid
 
@@ -22,32 +23,34 @@ class Connection(QObject, Serializable):
     def __init__(self, port_a: Port, port_b: Port = None, *,
                  style: StyleCollection, converter: TypeConverter = None):
         super().__init__()
-        self._uid = str(uuid.uuid4())
+        # Generated on first access of `id`; most connections never need one
+        self._uid = None
 
         if port_a is None:
             raise ValueError('port_a is required')
         elif port_a is port_b:
             raise ValueError('Cannot connect a port to itself')
 
-        if port_a.port_type == PortType.input:
+        port_a_type = port_a.port_type
+        if port_a_type == PortType.input:
             in_port = port_a
             out_port = port_b
         else:
             in_port = port_b
             out_port = port_a
 
-        if in_port is not None and out_port is not None:
-            if in_port.port_type == out_port.port_type:
+        if port_b is not None:
+            if port_b.port_type == port_a_type:
                 raise exceptions.PortsOfSameTypeError(
                     'Cannot connect two ports of the same type')
 
-        self._ports = {
-            PortType.input: in_port,
-            PortType.output: out_port
-        }
+        self._in_port = in_port
+        self._out_port = out_port
+        # (in, out), rebuilt by _set_port whenever either port changes
+        self._ports_tuple = (in_port, out_port)
 
         if in_port is not None:
-            if in_port.connections:
+            if in_port.has_connections:
                 conn, = in_port.connections
                 existing_in, existing_out = conn.ports
                 if existing_in == in_port and existing_out == out_port:
@@ -65,7 +68,7 @@ class Connection(QObject, Serializable):
             self._required_port = PortType.input
 
         self._last_hovered_node = None
-        self._converter = converter
+        self.type_converter = converter
         self._style = style
         self._connection_geometry = ConnectionGeometry(style)
         self._graphics_object = None
@@ -74,13 +77,15 @@ class Connection(QObject, Serializable):
         if self.is_complete:
             self.connection_made_incomplete.emit(self)
 
-        self.propagate_empty_data()
+        if self._in_port is not None:
+            self.propagate_empty_data()
         self.last_hovered_node = None
 
-        for port_type, port in self.valid_ports.items():
-            if port.node.graphics_object is not None:
-                port.node.graphics_object.update()
-            self._ports[port] = None
+        for port in (self._in_port, self._out_port):
+            if port is not None:
+                graphics_object = port.node.graphics_object
+                if graphics_object is not None:
+                    graphics_object.update()
 
         if self._graphics_object is not None:
             self._graphics_object._cleanup()
@@ -98,7 +103,7 @@ class Connection(QObject, Serializable):
         -------
         value : dict
         """
-        in_port, out_port = self.ports
+        in_port, out_port = self._in_port, self._out_port
         if not in_port and not out_port:
             return {}
 
@@ -110,16 +115,10 @@ class Connection(QObject, Serializable):
         )
 
         if self._converter:
-            def get_type_json(type: PortType):
-                node_type = self.data_type(type)
-                return dict(
-                    id=node_type.id,
-                    name=node_type.name
-                )
-
+            in_type, out_type = in_port.data_type, out_port.data_type
             connection_json["converter"] = {
-                "in": get_type_json(PortType.input),
-                "out": get_type_json(PortType.output),
+                "in": dict(id=in_type.id, name=in_type.name),
+                "out": dict(id=out_type.id, name=out_type.name),
             }
 
         return connection_json
@@ -133,6 +132,8 @@ class Connection(QObject, Serializable):
         -------
         uuid : str
         """
+        if self._uid is None:
+            self._uid = sys.intern(str(uuid.uuid4()))
         return self._uid
 
     @property
@@ -156,11 +157,14 @@ class Connection(QObject, Serializable):
         dragging : PortType
         """
         self._required_port = dragging
-        try:
-            port = self.valid_ports[dragging]
-        except KeyError:
-            ...
+        if dragging == PortType.input:
+            port = self._in_port
+        elif dragging == PortType.output:
+            port = self._out_port
         else:
+            port = None
+
+        if port is not None:
             port.remove_connection(self)
 
     @property
@@ -204,21 +208,37 @@ class Connection(QObject, Serializable):
         ----------
         port : Port
         """
-        if self._ports[port.port_type] is not None:
+        if self._get_port(port.port_type) is not None:
             raise ValueError('Port already specified')
 
         was_incomplete = not self.is_complete
-        self._ports[port.port_type] = port
+        self._set_port(port.port_type, port)
         self.updated.emit(self)
         self.required_port = PortType.none
         if self.is_complete and was_incomplete:
             self.connection_completed.emit(self)
 
     def remove_from_nodes(self):
-        for port in self._ports.values():
+        for port in (self._in_port, self._out_port):
             if port is not None:
                 port.remove_connection(self)
 
+    def _get_port(self, port_type: PortType) -> typing.Optional[Port]:
+        if port_type == PortType.input:
+            return self._in_port
+        if port_type == PortType.output:
+            return self._out_port
+        raise KeyError(port_type)
+
+    def _set_port(self, port_type: PortType, port: typing.Optional[Port]):
+        if port_type == PortType.input:
+            self._in_port = port
+        elif port_type == PortType.output:
+            self._out_port = port
+        else:
+            raise KeyError(port_type)
+        self._ports_tuple = (self._in_port, self._out_port)
+
     @property
     def geometry(self) -> ConnectionGeometry:
         """
@@ -242,18 +262,20 @@ class Connection(QObject, Serializable):
         -------
         value : Node
         """
-        port = self._ports[port_type]
+        port = self._get_port(port_type)
         return port.node if port is not None else None
 
     @property
     def nodes(self):
         # TODO namedtuple; TODO order
-        return (self.get_node(PortType.input), self.get_node(PortType.output))
+        in_port, out_port = self._ports_tuple
+        return (in_port.node if in_port is not None else None,
+                out_port.node if out_port is not None else None)
 
     @property
     def ports(self):
         # TODO namedtuple; TODO order
-        return (self._ports[PortType.input], self._ports[PortType.output])
+        return self._ports_tuple
 
     def get_port_index(self, port_type: PortType) -> int:
         """
@@ -267,7 +289,7 @@ class Connection(QObject, Serializable):
         -------
         index : int
         """
-        return self._ports[port_type].index
+        return self._get_port(port_type).index
 
     def clear_node(self, port_type: PortType):
         """
@@ -280,16 +302,18 @@ class Connection(QObject, Serializable):
         if self.is_complete:
             self.connection_made_incomplete.emit(self)
 
-        port = self._ports[port_type]
-        self._ports[port_type] = None
+        port = self._get_port(port_type)
+        self._set_port(port_type, None)
         port.remove_connection(self)
 
     @property
     def valid_ports(self):
-        return {port_type: port
-                for port_type, port in self._ports.items()
-                if port is not None
-                }
+        ports = {}
+        if self._in_port is not None:
+            ports[PortType.input] = self._in_port
+        if self._out_port is not None:
+            ports[PortType.output] = self._out_port
+        return ports
 
     def data_type(self, port_type: PortType) -> NodeDataType:
         """
@@ -303,15 +327,14 @@ class Connection(QObject, Serializable):
         -------
         value : NodeDataType
         """
-        ports = self.valid_ports
-        if not ports:
-            raise ValueError('No ports set')
-
-        try:
-            return ports[port_type].data_type
-        except KeyError:
-            valid_type, = ports
-            return ports[valid_type].data_type
+        in_port, out_port = self._in_port, self._out_port
+        if in_port is None:
+            if out_port is None:
+                raise ValueError('No ports set')
+            return out_port.data_type
+        if out_port is None or port_type != PortType.output:
+            return in_port.data_type
+        return out_port.data_type
 
     @property
     def type_converter(self) -> typing.Optional[TypeConverter]:
@@ -327,6 +350,8 @@ class Connection(QObject, Serializable):
     @type_converter.setter
     def type_converter(self, converter: TypeConverter):
         self._converter = converter
+        self._convert = (getattr(converter, 'convert', converter)
+                         if converter else None)
 
     @property
     def is_complete(self) -> bool:
@@ -337,7 +362,7 @@ class Connection(QObject, Serializable):
         -------
         value : bool
         """
-        return all(self._ports.values())
+        return self._in_port is not None and self._out_port is not None
 
     def propagate_data(self, node_data: NodeData):
         """
@@ -347,24 +372,24 @@ class Connection(QObject, Serializable):
         ----------
         node_data : NodeData
         """
-        in_port, out_port = self.ports
+        in_port = self._in_port
         if not in_port:
             return
 
-        if node_data is not None and self._converter:
-            node_data = self._converter(node_data)
+        if node_data is not None and self._convert is not None:
+            node_data = self._convert(node_data)
 
         in_port.node.propagate_data(node_data, in_port)
 
     @property
     def input_node(self) -> Node:
         'Input node'
-        return self._ports[PortType.input].node
+        return self._in_port.node
 
     @property
     def output_node(self) -> Node:
         'Output node'
-        return self._ports[PortType.output].node
+        return self._out_port.node
 
     # For backward-compatibility:
     output = output_node
@@ -418,4 +443,6 @@ class Connection(QObject, Serializable):
         return self._required_port != PortType.none
 
     def __repr__(self):
-        return (f'<{self.__class__.__name__} ports={self._ports}>')
+        ports = {PortType.input: self._in_port,
+                 PortType.output: self._out_port}
+        return (f'<{self.__class__.__name__} ports={ports}>')
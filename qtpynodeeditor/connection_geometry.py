@@ -1,9 +1,13 @@
 from qtpy.QtCore import QPointF, QRectF
+from qtpy.QtGui import QPainterPath, QPainterPathStroker
 
 from .port import PortType
 
 
 class ConnectionGeometry:
+    __slots__ = ('_in', '_out', '_line_width', '_hovered', '_point_diameter',
+                 '_bounding_rect', '_c1c2', '_cubic_path', '_stroke')
+
     def __init__(self, style):
         # local object coordinates
         self._in = QPointF(0, 0)
@@ -12,6 +16,9 @@ class ConnectionGeometry:
         self._line_width = 3.0
         self._hovered = False
         self._point_diameter = style.connection.point_diameter
+        # (endpoint key, value) caches for bounding_rect, points_c1_c2,
+        # cubic_path and stroke_path
+        self._clear_cache()
 
     def get_end_point(self, port_type: PortType) -> QPointF:
         """
@@ -40,9 +47,9 @@ class ConnectionGeometry:
         point : QPointF
         """
         if port_type == PortType.output:
-            self._out = point
+            self.set_out_point(point)
         elif port_type == PortType.input:
-            self._in = point
+            self.set_in_point(point)
         else:
             raise ValueError(port_type)
 
@@ -56,12 +63,73 @@ class ConnectionGeometry:
         offset : QPointF
         """
         if port_type == PortType.output:
-            self._out += offset
+            self.move_out_point(offset)
         elif port_type == PortType.input:
-            self._in += offset
+            self.move_in_point(offset)
         else:
             raise ValueError(port_type)
 
+    def set_in_point(self, point: QPointF):
+        """
+        Set the input (sink) end point
+
+        Parameters
+        ----------
+        point : QPointF
+        """
+        self._in = point
+        self._clear_cache()
+
+    def set_out_point(self, point: QPointF):
+        """
+        Set the output (source) end point
+
+        Parameters
+        ----------
+        point : QPointF
+        """
+        self._out = point
+        self._clear_cache()
+
+    def move_in_point(self, offset: QPointF):
+        """
+        Move the input (sink) end point
+
+        Parameters
+        ----------
+        offset : QPointF
+        """
+        self._in += offset
+        self._clear_cache()
+
+    def move_out_point(self, offset: QPointF):
+        """
+        Move the output (source) end point
+
+        Parameters
+        ----------
+        offset : QPointF
+        """
+        self._out += offset
+        self._clear_cache()
+
+    def _clear_cache(self):
+        'Drop the cached bounding rect, control points and paths'
+        self._bounding_rect = None
+        self._c1c2 = None
+        self._cubic_path = None
+        self._stroke = None
+
+    def _endpoint_key(self) -> tuple:
+        '''
+        Endpoint coordinates, used to validate the caches
+
+        get_end_point hands out the internal points, so the caches are also
+        checked against the coordinates rather than relying only on the
+        setters.
+        '''
+        return (self._in.x(), self._in.y(), self._out.x(), self._out.y())
+
     @property
     def bounding_rect(self) -> QRectF:
         """
@@ -71,15 +139,25 @@ class ConnectionGeometry:
         -------
         value : QRectF
         """
-        c1, c2 = self.points_c1_c2()
-        basic_rect = QRectF(self._out, self._in).normalized()
-        c1c2_rect = QRectF(c1, c2).normalized()
+        key = self._endpoint_key()
+        cached = self._bounding_rect
+        if cached is not None and cached[0] == key:
+            return QRectF(cached[1])
+
+        in_x, in_y, out_x, out_y = key
+        c1_x, c1_y, c2_x, c2_y = self._c1_c2_coords(key)
+        left = min(in_x, out_x, c1_x, c2_x)
+        top = min(in_y, out_y, c1_y, c2_y)
+        right = max(in_x, out_x, c1_x, c2_x)
+        bottom = max(in_y, out_y, c1_y, c2_y)
 
-        common_rect = basic_rect.united(c1c2_rect)
-        corner_offset = QPointF(self._point_diameter, self._point_diameter)
-        common_rect.setTopLeft(common_rect.topLeft() - corner_offset)
-        common_rect.setBottomRight(common_rect.bottomRight() + 2 * corner_offset)
-        return common_rect
+        # Pad by one point diameter at the top-left, two at the bottom-right
+        diameter = self._point_diameter
+        common_rect = QRectF(left - diameter, top - diameter,
+                             right - left + 3 * diameter,
+                             bottom - top + 3 * diameter)
+        self._bounding_rect = (key, common_rect)
+        return QRectF(common_rect)
 
     def points_c1_c2(self) -> tuple:
         """
@@ -92,27 +170,84 @@ class ConnectionGeometry:
         c2: QPointF
             The second point
         """
-        x_distance = self._in.x() - self._out.x()
+        c1_x, c1_y, c2_x, c2_y = self._c1_c2_coords(self._endpoint_key())
+        return QPointF(c1_x, c1_y), QPointF(c2_x, c2_y)
+
+    def _c1_c2_coords(self, key: tuple) -> tuple:
+        '''
+        Control point coordinates (c1_x, c1_y, c2_x, c2_y) as plain floats
+
+        Parameters
+        ----------
+        key : tuple
+            The endpoint coordinates, as returned by _endpoint_key
+        '''
+        cached = self._c1c2
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        in_x, in_y, out_x, out_y = key
+        x_distance = in_x - out_x
 
         default_offset = 200.0
-        x_offset = min((default_offset, abs(x_distance)))
-        y_offset = 0
+        x_offset = min(default_offset, abs(x_distance))
+        y_offset = 0.0
 
         x_ratio = 0.5
         if x_distance <= 0:
-            y_distance = self._in.y() - self._out.y() + 20
+            y_distance = in_y - out_y + 20
             y_direction = (-1.0 if y_distance < 0 else 1.0)
-            y_offset = y_direction * min((default_offset, abs(y_distance)))
+            y_offset = y_direction * min(default_offset, abs(y_distance))
             x_ratio = 1.0
 
         x_offset *= x_ratio
-        return (
-            QPointF(self._out.x() + x_offset,
-                    self._out.y() + y_offset),
+        coords = (out_x + x_offset, out_y + y_offset,
+                  in_x - x_offset, in_y - y_offset)
+        self._c1c2 = (key, coords)
+        return coords
+
+    def cubic_path(self) -> QPainterPath:
+        """
+        The cubic spline from source to sink
+
+        Cached until the end points change.  QPainterPath is implicitly
+        shared, so the copy returned is cheap.
 
-            QPointF(self._in.x() - x_offset,
-                    self._in.y() - y_offset)
-        )
+        Returns
+        -------
+        value : QPainterPath
+        """
+        key = self._endpoint_key()
+        cached = self._cubic_path
+        if cached is None or cached[0] != key:
+            c1, c2 = self.points_c1_c2()
+            cubic = QPainterPath(self._out)
+            cubic.cubicTo(c1, c2, self._in)
+            cached = self._cubic_path = (key, cubic)
+        return QPainterPath(cached[1])
+
+    def stroke_path(self, width: float) -> QPainterPath:
+        """
+        The outline of the cubic spline stroked with the given width
+
+        Cached until the end points or the width change.
+
+        Parameters
+        ----------
+        width : float
+
+        Returns
+        -------
+        value : QPainterPath
+        """
+        key = (self._endpoint_key(), width)
+        cached = self._stroke
+        if cached is None or cached[0] != key:
+            # The stroker follows the cubic natively; no need to flatten it
+            stroker = QPainterPathStroker()
+            stroker.setWidth(width)
+            cached = self._stroke = (key, stroker.createStroke(self.cubic_path()))
+        return QPainterPath(cached[1])
 
     @property
     def source(self) -> QPointF:
@@ -1,6 +1,6 @@
 import typing
 
-from qtpy.QtCore import QRectF
+from qtpy.QtCore import QPointF, QRectF
 from qtpy.QtGui import QPainter, QPainterPath
 from qtpy.QtWidgets import (QGraphicsBlurEffect, QGraphicsItem,
                             QGraphicsObject, QGraphicsSceneHoverEvent,
@@ -17,6 +17,16 @@ if typing.TYPE_CHECKING:
 
 debug_drawing = False
 
+# Item changes which affect the item-to-scene mapping
+_SCENE_MAPPING_CHANGES = frozenset({
+    QGraphicsItem.ItemPositionHasChanged,
+    QGraphicsItem.ItemTransformHasChanged,
+    QGraphicsItem.ItemRotationHasChanged,
+    QGraphicsItem.ItemScaleHasChanged,
+    QGraphicsItem.ItemTransformOriginPointHasChanged,
+    QGraphicsItem.ItemParentHasChanged,
+})
+
 
 class ConnectionGraphicsObject(QGraphicsObject):
     def __init__(self, scene, connection):
@@ -33,11 +43,16 @@ class ConnectionGraphicsObject(QGraphicsObject):
         self._connection = connection
         self._geometry = connection.geometry
         self._style = connection.style.connection
+        # port_type -> (end point x, end point y, scene position)
+        self._end_scene_positions = {}
+        # (inverted scene transform, invertible), used by move()
+        self._inverted_scene_transform = None
 
         self._scene.addItem(self)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemIsFocusable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
 
         # self.add_graphics_effect()
@@ -88,29 +103,81 @@ class ConnectionGraphicsObject(QGraphicsObject):
     def set_geometry_changed(self):
         self.prepareGeometryChange()
 
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: typing.Any) -> typing.Any:
+        """
+        itemChange
+
+        Parameters
+        ----------
+        change : QGraphicsItem.GraphicsItemChange
+        value : any
+
+        Returns
+        -------
+        value : any
+        """
+        if change in _SCENE_MAPPING_CHANGES:
+            self._end_scene_positions.clear()
+            self._inverted_scene_transform = None
+
+        return super().itemChange(change, value)
+
+    def end_scene_position(self, port_type: PortType) -> QPointF:
+        """
+        The scene position of the given end of the connection
+
+        The result is cached until the end point or the item position (or
+        transform) changes.
+
+        Parameters
+        ----------
+        port_type : PortType
+
+        Returns
+        -------
+        value : QPointF
+        """
+        end_point = self._geometry.get_end_point(port_type)
+        x, y = end_point.x(), end_point.y()
+        try:
+            cached_x, cached_y, scene_pos = self._end_scene_positions[port_type]
+        except KeyError:
+            ...
+        else:
+            if cached_x == x and cached_y == y:
+                return QPointF(scene_pos)
+
+        scene_pos = self.mapToScene(end_point)
+        self._end_scene_positions[port_type] = (x, y, scene_pos)
+        return QPointF(scene_pos)
+
     def move(self):
         """
         Updates the position of both ends
         """
         conn = self._connection
         cgo = conn.graphics_object
-
-        for port_type in (PortType.input, PortType.output):
-            node = self._connection.get_node(port_type)
-            if node is None:
+        geom = self._geometry
+        if self._inverted_scene_transform is None:
+            self._inverted_scene_transform = self.sceneTransform().inverted()
+        inverted, invertible = self._inverted_scene_transform
+        in_port, out_port = conn.ports
+
+        for port_type, port, set_point in (
+                (PortType.input, in_port, geom.set_in_point),
+                (PortType.output, out_port, geom.set_out_point)):
+            if port is None:
                 continue
 
+            node = port.node
             node_graphics = node.graphics_object
             node_geom = node.geometry
             scene_pos = node_geom.port_scene_position(
-                port_type, self._connection.get_port_index(port_type),
-                node_graphics.sceneTransform()
+                port_type, port.index, node_graphics.sceneTransform()
             )
 
-            inverted, invertible = self.sceneTransform().inverted()
             if invertible:
-                connection_pos = inverted.map(scene_pos)
-                self._geometry.set_end_point(port_type, connection_pos)
+                set_point(inverted.map(scene_pos))
 
             cgo.set_geometry_changed()
             cgo.update()
@@ -1,7 +1,7 @@
 import typing
 
 from qtpy.QtCore import QLineF, QPointF, QSize, Qt
-from qtpy.QtGui import QIcon, QPainter, QPainterPath, QPainterPathStroker, QPen
+from qtpy.QtGui import QBrush, QIcon, QLinearGradient, QPainter, QPainterPath, QPen
 
 from .connection_geometry import ConnectionGeometry
 from .enums import PortType
@@ -15,14 +15,7 @@ use_debug_drawing = False
 
 
 def cubic_path(geom):
-    source, sink = geom.source, geom.sink
-    c1, c2 = geom.points_c1_c2()
-
-    # cubic spline
-    cubic = QPainterPath(source)
-
-    cubic.cubicTo(c1, c2, sink)
-    return cubic
+    return geom.cubic_path()
 
 
 def debug_drawing(painter, connection):
@@ -126,28 +119,21 @@ def draw_normal_line(painter, connection, style):
     if gradient_color:
         painter.setBrush(Qt.NoBrush)
 
-        c = normal_color_out
+        color_out, color_in = normal_color_out, normal_color_in
         if selected:
-            c = c.darker(200)
-
-        p.setColor(c)
+            color_out, color_in = color_out.darker(200), color_in.darker(200)
+
+        # Switch from the output to the input data type color at the
+        # midpoint, in a single stroke of the path; the two stops a tiny
+        # epsilon apart keep the split hard instead of blending
+        gradient = QLinearGradient(geom.source, geom.sink)
+        gradient.setColorAt(0.0, color_out)
+        gradient.setColorAt(0.5, color_out)
+        gradient.setColorAt(0.5 + 1e-6, color_in)
+        gradient.setColorAt(1.0, color_in)
+        p.setBrush(QBrush(gradient))
         painter.setPen(p)
-
-        segments = 60
-
-        for i in range(segments):
-            ratio_prev = float(i) / segments
-            ratio = float(i + 1) / segments
-
-            if i == segments / 2:
-                c = normal_color_in
-                if selected:
-                    c = c.darker(200)
-
-                p.setColor(c)
-                painter.setPen(p)
-
-            painter.drawLine(cubic.pointAtPercent(ratio_prev), cubic.pointAtPercent(ratio))
+        painter.drawPath(cubic)
 
         icon = QIcon(":convert.png")
 
@@ -208,15 +194,4 @@ class ConnectionPainter:
         -------
         value : QPainterPath
         """
-        cubic = cubic_path(geom)
-        source = geom.source
-        result = QPainterPath(source)
-        segments = 20
-
-        for i in range(segments):
-            ratio = float(i + 1) / segments
-            result.lineTo(cubic.pointAtPercent(ratio))
-
-        stroker = QPainterPathStroker()
-        stroker.setWidth(10.0)
-        return stroker.createStroke(result)
+        return geom.stroke_path(10.0)
@@ -23,9 +23,11 @@ from .type_converter import TypeConverter
 def locate_node_at(scene_point, scene, view_transform):
     items = scene.items(scene_point, Qt.IntersectsItemShape,
                         Qt.DescendingOrder, view_transform)
-    filtered_items = [item for item in items
-                      if isinstance(item, NodeGraphicsObject)]
-    return filtered_items[0].node if filtered_items else None
+    # Items are topmost-first; stop at the first node
+    for item in items:
+        if isinstance(item, NodeGraphicsObject):
+            return item.node
+    return None
 
 
 class FlowSceneModel:
@@ -47,7 +49,8 @@ class FlowSceneModel:
 
     def __init__(self, registry=None, **kwargs):
         super().__init__(**kwargs)
-        self._connections = []
+        # Insertion-ordered set of connections, for O(1) removal
+        self._connections = {}
         self._nodes = {}
 
         if registry is None:
@@ -55,10 +58,16 @@ class FlowSceneModel:
 
         self._registry = registry
 
+        # Scene housekeeping always runs in the scene's thread, so the
+        # handlers are invoked directly instead of through AutoConnection's
+        # per-emit thread check.
         # this connection should come first
-        self.connection_created.connect(self._setup_connection_signals)
-        self.connection_created.connect(self._send_connection_created_to_nodes)
-        self.connection_deleted.connect(self._send_connection_deleted_to_nodes)
+        self.connection_created.connect(self._setup_connection_signals,
+                                        Qt.DirectConnection)
+        self.connection_created.connect(self._send_connection_created_to_nodes,
+                                        Qt.DirectConnection)
+        self.connection_deleted.connect(self._send_connection_deleted_to_nodes,
+                                        Qt.DirectConnection)
 
     @property
     def registry(self) -> DataModelRegistry:
@@ -255,7 +264,7 @@ class FlowSceneModel:
         # A leaf node is a node with no input ports, or all possible input ports empty
         def is_node_leaf(node, model):
             for port in node[PortType.input].values():
-                if not port.connections:
+                if not port.has_connections:
                     return False
 
             return True
@@ -381,8 +390,8 @@ class FlowSceneModel:
         connection : Connection
         """
         try:
-            self._connections.remove(connection)
-        except ValueError:
+            del self._connections[connection]
+        except KeyError:
             ...
         else:
             connection.remove_from_nodes()
@@ -534,7 +543,7 @@ class FlowScene(FlowSceneModel, QGraphicsScene):
         cgo = ConnectionGraphicsObject(self, connection)
         # after self function connection points are set to node port
         connection.graphics_object = cgo
-        self._connections.append(connection)
+        self._connections[connection] = None
 
         if port_a and port_b:
             in_port, out_port = connection.ports
@@ -1,4 +1,5 @@
 import collections
+import sys
 import typing
 import uuid
 from typing import Optional
@@ -33,7 +34,8 @@ class Node(QObject, Serializable):
         '''
         super().__init__()
         self._model = data_model
-        self._uid = str(uuid.uuid4())
+        # Interned, as ids are compared in Node.__eq__ and used as scene keys
+        self._uid = sys.intern(str(uuid.uuid4()))
         self._style = data_model.node_style
         self._state = NodeState(self)
         self._geometry = NodeGeometry(self)
@@ -164,7 +166,7 @@ class Node(QObject, Serializable):
         ----------
         state : dict
         """
-        self._uid = state["id"]
+        self._uid = sys.intern(state["id"])
         if self._graphics_obj:
             pos = state["position"]
             self.position = (pos["x"], pos["y"])
@@ -294,9 +296,7 @@ class Node(QObject, Serializable):
         ----------
         port : Port
         """
-        node_data = port.data
-        for conn in port.connections:
-            conn.propagate_data(node_data)
+        port.propagate_data(port.data)
 
     def on_node_size_updated(self):
         """
@@ -1,5 +1,6 @@
 import logging
 import typing
+import weakref
 from typing import Optional
 
 from qtpy.QtCore import QPointF
@@ -20,6 +21,27 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pre-resolved enum members; these are consulted on every mouse move while
+# dragging a connection.
+_PORT_IN = PortType.input
+_PORT_OUT = PortType.output
+_PORT_NONE = PortType.none
+
+
+def _weak_ref(obj):
+    'Weak reference to `obj`, allowing for None'
+    return weakref.ref(obj) if obj is not None else None
+
+
+def _dereference(ref, name):
+    'Dereference a weak reference, raising NodeConnectionFailure if it is dead'
+    if ref is None:
+        return None
+    obj = ref()
+    if obj is None:
+        raise NodeConnectionFailure(f'The interaction {name} has been deleted')
+    return obj
+
 
 class NodeConnectionInteraction:
     def __init__(self, node: 'Node',
@@ -34,10 +56,27 @@ class NodeConnectionInteraction:
         node : Node
         connection : Connection
         scene : FlowScene
+
+        Notes
+        -----
+        Only weak references are kept to the node, connection, and scene, so
+        that a lingering interaction does not keep a deleted graph alive.
         '''
-        self._node = node
-        self._connection = connection
-        self._scene = scene
+        self._node_ref = _weak_ref(node)
+        self._connection_ref = _weak_ref(connection)
+        self._scene_ref = _weak_ref(scene)
+
+    @property
+    def _node(self) -> 'Node':
+        return _dereference(self._node_ref, 'node')
+
+    @property
+    def _connection(self) -> 'Connection':
+        return _dereference(self._connection_ref, 'connection')
+
+    @property
+    def _scene(self) -> 'FlowScene':
+        return _dereference(self._scene_ref, 'scene')
 
     @property
     def creates_cycle(self):
@@ -72,18 +111,20 @@ class NodeConnectionInteraction:
         Raises
         ------
         NodeConnectionFailure
+            If the node, connection, or scene has since been deleted
         ConnectionDataTypeFailure
             If port data types are not compatible
         """
         # 1) Connection requires a port
         required_port = self.connection_required_port
-        if required_port == PortType.none:
+        if required_port == _PORT_NONE:
             raise ConnectionRequiresPortFailure('Connection requires a port')
-        elif required_port not in (PortType.input, PortType.output):
+        elif required_port not in (_PORT_IN, _PORT_OUT):
             raise ValueError(f'Invalid port specified {required_port}')
 
         # 1.5) Forbid connecting the node to itself
-        node = self.connection_node
+        attached_port = opposite_port(required_port)
+        node = self._connection.get_node(attached_port)
         if node == self._node:
             raise ConnectionSelfFailure(f'Cannot connect {node} to itself')
 
@@ -102,7 +143,7 @@ class NodeConnectionInteraction:
             )
 
         # 4) Cycle check
-        if self.creates_cycle:
+        if node.has_connection_by_port_type(self._node, required_port):
             raise ConnectionCycleFailure(
                 f'Connecting {self._node} and {node} would introduce a '
                 f'cycle in the graph'
@@ -110,14 +151,14 @@ class NodeConnectionInteraction:
 
         # 5) Connection type equals node port type, or there is a registered
         #    type conversion that can translate between the two
-        connection_data_type = self._connection.data_type(opposite_port(required_port))
+        connection_data_type = self._connection.data_type(attached_port)
 
         candidate_node_data_type = port.data_type
         if connection_data_type.id == candidate_node_data_type.id:
             return port, None
 
         registry = self._scene.registry
-        if required_port == PortType.input:
+        if required_port == _PORT_IN:
             converter = registry.get_type_converter(connection_data_type,
                                                     candidate_node_data_type)
         else:
@@ -149,6 +190,8 @@ class NodeConnectionInteraction:
         # 1) Check conditions from 'can_connect'
         try:
             port, converter = self.can_connect()
+            # Hold on to the node and connection for the remaining steps
+            node, connection = self._node, self._connection
         except NodeConnectionFailure as ex:
             logger.debug('Cannot connect node', exc_info=ex)
             logger.info('Cannot connect node: %s', ex)
@@ -157,20 +200,20 @@ class NodeConnectionInteraction:
         # 1.5) If the connection is possible but a type conversion is needed,
         # assign a convertor to connection
         if converter:
-            self._connection.type_converter = converter
+            connection.type_converter = converter
 
         # 2) Assign node to required port in Connection
-        port.add_connection(self._connection)
+        port.add_connection(connection)
 
         # 3) Assign Connection to empty port in NodeState
         # The port is not longer required after this function
-        self._connection.connect_to(port)
+        connection.connect_to(port)
 
         # 4) Adjust Connection geometry
-        self._node.graphics_object.move_connections()
+        node.graphics_object.move_connections()
 
         # 5) Poke model to intiate data transfer
-        _, out_port = self._connection.ports
+        _, out_port = connection.ports
         if out_port:
             out_port.node.on_data_updated(out_port)
 
@@ -186,21 +229,26 @@ class NodeConnectionInteraction:
         Parameters
         ----------
         port_to_disconnect : PortType
+
+        Raises
+        ------
+        NodeConnectionFailure
+            If the node or connection has since been deleted
         """
-        port_index = self._connection.get_port_index(port_to_disconnect)
+        connection = self._connection
         state = self._node.state
+        port_index = connection.get_port_index(port_to_disconnect)
 
         # clear pointer to Connection in the NodeState
-        state.erase_connection(port_to_disconnect, port_index,
-                               self._connection)
+        state.erase_connection(port_to_disconnect, port_index, connection)
 
         # Propagate invalid data to IN node
-        self._connection.propagate_empty_data()
+        connection.propagate_empty_data()
 
         # clear Connection side
-        self._connection.clear_node(port_to_disconnect)
-        self._connection.required_port = port_to_disconnect
-        self._connection.graphics_object.grabMouse()
+        connection.clear_node(port_to_disconnect)
+        connection.required_port = port_to_disconnect
+        connection.graphics_object.grabMouse()
 
     @property
     def connection_required_port(self) -> PortType:
@@ -231,10 +279,7 @@ class NodeConnectionInteraction:
         -------
         value : QPointF
         """
-        go = self._connection.graphics_object
-        geometry = self._connection.geometry
-        end_point = geometry.get_end_point(port_type)
-        return go.mapToScene(end_point)
+        return self._connection.graphics_object.end_scene_position(port_type)
 
     def node_port_scene_position(self, port_type: PortType, port_index: int) -> QPointF:
         """
@@ -285,5 +330,4 @@ class NodeConnectionInteraction:
         -------
         value : bool
         """
-        port = self._node.state[port_type][port_index]
-        return port.can_connect
+        return self._node.state[port_type][port_index].can_connect
@@ -20,6 +20,8 @@ class NodeData:
     The actual data is stored in subtypes
     """
 
+    __slots__ = ()
+
     data_type = NodeDataType(None, None)
 
     def __init_subclass__(cls, **kwargs):
@@ -1,5 +1,5 @@
-import math
 import typing
+import weakref
 
 from qtpy.QtCore import QPointF, QRect, QRectF, QSizeF
 from qtpy.QtGui import QFont, QFontMetrics, QTransform
@@ -12,7 +12,39 @@ if typing.TYPE_CHECKING:
     from .node import Node  # noqa
 
 
+_TEXT_WIDTH_CACHE_SIZE = 32
+
+
 class NodeGeometry:
+    __slots__ = (
+        '_bold_font_metrics',
+        '_bold_text_widths',
+        '_dragging_pos',
+        '_entry_height',
+        '_entry_width',
+        '_font_key',
+        '_font_metrics',
+        '_height',
+        '_hovered',
+        '_input_port_width',
+        '_model',
+        '_node',
+        '_output_port_width',
+        '_port_positions',
+        '_spacing',
+        '_style',
+        '_validation_height',
+        '_width',
+    )
+
+    # Metrics of the default font, shared by all instances until a specific
+    # font is given to `recalculate_size`.  Created on first use, as a
+    # QGuiApplication is required.
+    _default_font_metrics = None
+    _default_bold_font_metrics = None
+    # QFont.key() -> QFontMetrics, shared between instances while in use
+    _font_metrics_cache = weakref.WeakValueDictionary()
+
     def __init__(self, node: 'Node'):
         super().__init__()
         self._node = node
@@ -20,7 +52,10 @@ class NodeGeometry:
         self._dragging_pos = QPointF(-1000, -1000)
         self._entry_width = 0
         self._entry_height = 20
-        self._font_metrics = QFontMetrics(QFont())
+        (self._font_metrics,
+         self._bold_font_metrics) = self._get_default_font_metrics()
+        # QFont.key() of the font last given to `recalculate_size`
+        self._font_key = None
         self._height = 150
         self._hovered = False
         self._input_port_width = 70
@@ -28,10 +63,53 @@ class NodeGeometry:
         self._spacing = 20
         self._style = node.style
         self._width = 100
+        # Validation message height as of the last `recalculate_size`, or
+        # None if the model was valid at the time
+        self._validation_height = None
+        # text -> width in the bold font; see `_bold_text_width`
+        self._bold_text_widths = {}
+        # port_type -> (key, local port positions); see `port_positions`
+        self._port_positions = {}
+
+    @staticmethod
+    def _get_default_font_metrics() -> tuple[QFontMetrics, QFontMetrics]:
+        """
+        The shared default (normal, bold) font metrics
+
+        Returns
+        -------
+        value : (QFontMetrics, QFontMetrics)
+        """
+        if NodeGeometry._default_font_metrics is None:
+            font = QFont()
+            NodeGeometry._default_font_metrics = (
+                NodeGeometry._get_font_metrics(font))
+            font.setBold(True)
+            NodeGeometry._default_bold_font_metrics = (
+                NodeGeometry._get_font_metrics(font))
+
+        return (NodeGeometry._default_font_metrics,
+                NodeGeometry._default_bold_font_metrics)
+
+    @staticmethod
+    def _get_font_metrics(font: QFont) -> QFontMetrics:
+        """
+        Font metrics for `font`, shared with other instances using it
+
+        Parameters
+        ----------
+        font : QFont
 
-        f = QFont()
-        f.setBold(True)
-        self._bold_font_metrics = QFontMetrics(f)
+        Returns
+        -------
+        value : QFontMetrics
+        """
+        key = font.key()
+        metrics = NodeGeometry._font_metrics_cache.get(key)
+        if metrics is None:
+            metrics = QFontMetrics(font)
+            NodeGeometry._font_metrics_cache[key] = metrics
+        return metrics
 
     @property
     def height(self) -> int:
@@ -46,7 +124,7 @@ class NodeGeometry:
 
     @height.setter
     def height(self, h: int):
-        self._height = int(h)
+        self._height = h if h.__class__ is int else int(h)
 
     @property
     def width(self) -> int:
@@ -61,7 +139,8 @@ class NodeGeometry:
 
     @width.setter
     def width(self, width: int):
-        self._width = int(width)
+        self._width = width if width.__class__ is int else int(width)
+        self._port_positions.clear()
 
     @property
     def entry_height(self) -> int:
@@ -76,7 +155,8 @@ class NodeGeometry:
 
     @entry_height.setter
     def entry_height(self, h: int):
-        self._entry_height = int(h)
+        self._entry_height = h if h.__class__ is int else int(h)
+        self._port_positions.clear()
 
     @property
     def entry_width(self) -> int:
@@ -91,7 +171,7 @@ class NodeGeometry:
 
     @entry_width.setter
     def entry_width(self, width: int):
-        self._entry_width = int(width)
+        self._entry_width = width if width.__class__ is int else int(width)
 
     @property
     def spacing(self) -> int:
@@ -106,7 +186,8 @@ class NodeGeometry:
 
     @spacing.setter
     def spacing(self, s: int):
-        self._spacing = int(s)
+        self._spacing = s if s.__class__ is int else int(s)
+        self._port_positions.clear()
 
     @property
     def hovered(self) -> bool:
@@ -132,7 +213,7 @@ class NodeGeometry:
         -------
         value : int
         """
-        return self._model.num_ports[PortType.output]
+        return len(self._node.state[PortType.output])
 
     @property
     def num_sinks(self) -> int:
@@ -143,7 +224,7 @@ class NodeGeometry:
         -------
         value : int
         """
-        return self._model.num_ports[PortType.input]
+        return len(self._node.state[PortType.input])
 
     @property
     def dragging_position(self) -> QPointF:
@@ -196,42 +277,60 @@ class NodeGeometry:
             Updates size if the QFontMetrics is changed
         """
         if font is not None:
-            font_metrics = QFontMetrics(font)
+            # Painting passes the same font on every call; QFont.key() is a
+            # cheap way to detect that before building any metrics.
+            font_key = font.key()
+            if font_key == self._font_key:
+                return
+
+            self._font_key = font_key
+            font_metrics = self._get_font_metrics(font)
             bold_font = QFont(font)
             bold_font.setBold(True)
-            bold_font_metrics = QFontMetrics(bold_font)
-            if self._bold_font_metrics == bold_font_metrics:
+            bold_font_metrics = self._get_font_metrics(bold_font)
+            if (self._bold_font_metrics is bold_font_metrics or
+                    self._bold_font_metrics == bold_font_metrics):
                 return
 
             self._font_metrics = font_metrics
             self._bold_font_metrics = bold_font_metrics
+            self._bold_text_widths.clear()
 
+        model = self._model
+        state = self._node.state
+        spacing = self._spacing
         self._entry_height = self._font_metrics.height()
 
-        max_num_of_entries = max((self.num_sinks, self.num_sources))
-        step = self._entry_height + self._spacing
+        max_num_of_entries = max((len(state[PortType.input]),
+                                  len(state[PortType.output])))
+        step = self._entry_height + spacing
         height = step * max_num_of_entries
 
-        widget = self._model.embedded_widget()
+        widget = model.embedded_widget()
         if widget:
             height = max((height, widget.height()))
 
         height += self.caption_height
         self._input_port_width = self.port_width(PortType.input)
         self._output_port_width = self.port_width(PortType.output)
-        width = self._input_port_width + self._output_port_width + 2 * self._spacing
+        width = self._input_port_width + self._output_port_width + 2 * spacing
 
         if widget:
             width += widget.width()
 
         width = max((width, self.caption_width))
 
-        if self._model.validation_state() != NodeValidationState.valid:
+        if model.validation_state() != NodeValidationState.valid:
+            validation_height = self.validation_height
             width = max((width, self.validation_width))
-            height += self.validation_height + self._spacing
+            height += validation_height + spacing
+        else:
+            validation_height = None
 
         self._width = width
         self._height = height
+        self._validation_height = validation_height
+        self._port_positions.clear()
 
     def port_scene_position(self, port_type: PortType, index: int,
                             t: QTransform = None) -> QPointF:
@@ -248,24 +347,54 @@ class NodeGeometry:
         -------
         value : QPointF
         """
+        if index < 0:
+            raise IndexError(f'Invalid port index: {index}')
+        result = self.port_positions(port_type)[index]
         if t is None:
-            t = QTransform()
+            return QPointF(result)
+        return t.map(result)
 
-        step = self._entry_height + self._spacing
-        total_height = float(self.caption_height) + step * index
-        # TODO_UPSTREAM: why?
-        total_height += step / 2.0
+    def port_positions(self, port_type: PortType) -> tuple[QPointF, ...]:
+        """
+        Local positions of all ports of the given type, in index order
+
+        The positions are cached until the geometry, the connection point
+        diameter of the style, or the caption height changes.  The points are
+        shared and must not be modified; see `port_scene_position` for a
+        copy of a single position.
+
+        Parameters
+        ----------
+        port_type : PortType
+
+        Returns
+        -------
+        value : tuple of QPointF
+        """
+        # The style and the model caption can change without a resize
+        diameter = self._style.connection_point_diameter
+        caption_height = self.caption_height
+        key = (diameter, caption_height)
+        cached = self._port_positions.get(port_type)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         if port_type == PortType.output:
-            x = self._width + self._style.connection_point_diameter
-            result = QPointF(x, total_height)
+            x = self._width + diameter
         elif port_type == PortType.input:
-            x = -float(self._style.connection_point_diameter)
-            result = QPointF(x, total_height)
+            x = -float(diameter)
         else:
             raise ValueError(port_type)
 
-        return t.map(result)
+        step = self._entry_height + self._spacing
+        # TODO_UPSTREAM: why?
+        y = float(caption_height) + step / 2.0
+        positions = tuple(
+            QPointF(x, y + step * index)
+            for index in range(len(self._node.state[port_type]))
+        )
+        self._port_positions[port_type] = (key, positions)
+        return positions
 
     def check_hit_scene_point(self, port_type: PortType, scene_point: QPointF,
                               scene_transform: QTransform) -> typing.Optional[Port]:
@@ -291,17 +420,41 @@ class NodeGeometry:
         if port_type == PortType.none:
             return None
 
-        nearby_port = None
-
-        tolerance = 2.0 * self._style.connection_point_diameter
-        for idx, port in self._node.state[port_type].items():
-            pos = port.get_mapped_scene_position(scene_transform) - scene_point
-            distance = math.sqrt(QPointF.dotProduct(pos, pos))
-            if distance < tolerance:
-                nearby_port = port
-                break
+        # Compare squared distances to avoid a square root per port
+        diameter = self._style.connection_point_diameter
+        tolerance_sq = (2.0 * diameter) ** 2
+        ports = self._node.state[port_type]
+
+        if not scene_transform.isAffine():
+            for idx, port in ports.items():
+                pos = self.port_scene_position(port_type, idx, scene_transform)
+                pos -= scene_point
+                if QPointF.dotProduct(pos, pos) < tolerance_sq:
+                    return port
+            return None
 
-        return nearby_port
+        # All ports of a type share an x coordinate and are evenly spaced in
+        # y (see `port_scene_position`), so apply the affine transform with
+        # plain floats rather than mapping a QPointF per port.
+        step = self._entry_height + self._spacing
+        y = float(self.caption_height) + step / 2.0
+        x = (self._width + diameter if port_type == PortType.output
+             else -float(diameter))
+
+        t = scene_transform
+        m11, m12, m21, m22 = t.m11(), t.m12(), t.m21(), t.m22()
+        # Scene offset of the first port from `scene_point`, and the scene
+        # offset between consecutive ports:
+        offset_x = m11 * x + m21 * y + t.dx() - scene_point.x()
+        offset_y = m12 * x + m22 * y + t.dy() - scene_point.y()
+        step_x, step_y = m21 * step, m22 * step
+        for idx, port in ports.items():
+            dx = offset_x + step_x * idx
+            dy = offset_y + step_y * idx
+            if dx * dx + dy * dy < tolerance_sq:
+                return port
+
+        return None
 
     @property
     def resize_rect(self) -> QRect:
@@ -331,23 +484,25 @@ class NodeGeometry:
         if not widget:
             return QPointF()
 
-        if (widget.sizePolicy().verticalPolicy() == QSizePolicy.MinimumExpanding or
-                widget.sizePolicy().verticalPolicy() == QSizePolicy.Expanding):
+        x = self._spacing + self._input_port_width
+        caption_height = self.caption_height
+        vertical_policy = widget.sizePolicy().verticalPolicy()
+        if vertical_policy in (QSizePolicy.MinimumExpanding,
+                               QSizePolicy.Expanding):
             # If the widget wants to use as much vertical space as possible,
             # place it immediately after the caption.
-            return QPointF(self._spacing + self.port_width(PortType.input),
-                           self.caption_height)
+            return QPointF(x, caption_height)
 
-        if self._model.validation_state() != NodeValidationState.valid:
+        validation_height = self._validation_height
+        if validation_height is not None:
             return QPointF(
-                self._spacing + self.port_width(PortType.input),
-                (self.caption_height + self._height - self.validation_height -
+                x,
+                (caption_height + self._height - validation_height -
                  self._spacing - widget.height()) / 2.0,
             )
 
         return QPointF(
-            self._spacing + self.port_width(PortType.input),
-            (self.caption_height + self._height - widget.height()) / 2.0
+            x, (caption_height + self._height - widget.height()) / 2.0
         )
 
     def equivalent_widget_height(self) -> int:
@@ -360,8 +515,8 @@ class NodeGeometry:
         '''
         base_height = self.height - self.caption_height
 
-        if self._model.validation_state() != NodeValidationState.valid:
-            return base_height + self.validation_height
+        if self._validation_height is not None:
+            return base_height + self._validation_height
 
         return base_height
 
@@ -375,7 +530,8 @@ class NodeGeometry:
         value : int
         """
         msg = self._model.validation_message()
-        return self._bold_font_metrics.boundingRect(msg).height()
+        # A single line of text is as tall as the font, if non-empty
+        return self._bold_font_metrics.height() if msg else 0
 
     @property
     def validation_width(self) -> int:
@@ -387,7 +543,7 @@ class NodeGeometry:
         value : int
         """
         msg = self._model.validation_message()
-        return self._bold_font_metrics.boundingRect(msg).width()
+        return self._bold_text_width(msg)
 
     @staticmethod
     def calculate_node_position_between_node_ports(
@@ -426,15 +582,21 @@ class NodeGeometry:
         if (source_node.graphics_object is None
                 or target_node.graphics_object is None):
             raise ValueError('Uninitialized node')
-        converter_node_pos = (
-            source_node.graphics_object.pos()
-            + source_node.geometry.port_scene_position(source_port, source_port_index)
-            + target_node.graphics_object.pos()
-            + target_node.geometry.port_scene_position(target_port, target_port_index)
-        ) / 2.0
-        converter_node_pos.setX(converter_node_pos.x() - new_node.geometry.width / 2.0)
-        converter_node_pos.setY(converter_node_pos.y() - new_node.geometry.height / 2.0)
-        return converter_node_pos
+        source_pos = source_node.graphics_object.pos()
+        source_port_pos = source_node.geometry.port_scene_position(
+            source_port, source_port_index)
+        target_pos = target_node.graphics_object.pos()
+        target_port_pos = target_node.geometry.port_scene_position(
+            target_port, target_port_index)
+        new_geometry = new_node.geometry
+        return QPointF(
+            (source_pos.x() + source_port_pos.x() +
+             target_pos.x() + target_port_pos.x()) / 2.0
+            - new_geometry.width / 2.0,
+            (source_pos.y() + source_port_pos.y() +
+             target_pos.y() + target_port_pos.y()) / 2.0
+            - new_geometry.height / 2.0,
+        )
 
     @property
     def caption_height(self) -> int:
@@ -448,7 +610,8 @@ class NodeGeometry:
         if not self._model.caption_visible:
             return 0
         name = self._model.caption
-        return self._bold_font_metrics.boundingRect(name).height()
+        # A single line of text is as tall as the font, if non-empty
+        return self._bold_font_metrics.height() if name else 0
 
     @property
     def caption_width(self) -> int:
@@ -462,7 +625,32 @@ class NodeGeometry:
         if not self._model.caption_visible:
             return 0
         name = self._model.caption
-        return self._bold_font_metrics.boundingRect(name).width()
+        return self._bold_text_width(name)
+
+    def _bold_text_width(self, text: str) -> int:
+        """
+        Horizontal advance of `text` in the bold font, cached by text
+
+        Parameters
+        ----------
+        text : str
+
+        Returns
+        -------
+        value : int
+        """
+        try:
+            return self._bold_text_widths[text]
+        except KeyError:
+            ...
+
+        if len(self._bold_text_widths) >= _TEXT_WIDTH_CACHE_SIZE:
+            # Validation messages may vary; do not grow without bound
+            self._bold_text_widths.clear()
+
+        width = self._bold_font_metrics.horizontalAdvance(text)
+        self._bold_text_widths[text] = width
+        return width
 
     def port_width(self, port_type: PortType) -> int:
         """
@@ -476,13 +664,17 @@ class NodeGeometry:
         -------
         value : int
         """
-        names = [port.display_text
-                 for port in self._node[port_type].values()]
-        if not names:
+        ports = self._node[port_type]
+        if not ports:
             return 0
 
-        return max(self._font_metrics.horizontalAdvance(name)
-                   for name in names)
+        horizontal_advance = self._font_metrics.horizontalAdvance
+        width = 0
+        for port in ports.values():
+            port_width = horizontal_advance(port.display_text)
+            if port_width > width:
+                width = port_width
+        return width
 
     @property
     def size(self):
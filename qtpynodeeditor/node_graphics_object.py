@@ -28,6 +28,9 @@ class NodeGraphicsObject(QGraphicsObject):
         self.setFlag(QGraphicsItem.ItemIsFocusable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
+        # Provide an accurate exposedRect to paint(), which skips drawing
+        # text outside of it
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
 
         self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
@@ -118,11 +121,12 @@ class NodeGraphicsObject(QGraphicsObject):
         """
         from .node_painter import NodePainter
 
-        # TODO
-        painter.setClipRect(option.exposedRect)
+        exposed_rect = option.exposedRect
+        painter.setClipRect(exposed_rect)
         NodePainter.paint(painter, self._node, self._scene,
                           node_style=self._style.node,
                           connection_style=self._style.connection,
+                          exposed_rect=exposed_rect,
                           )
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: typing.Any) -> typing.Any:
@@ -1,8 +1,12 @@
+import functools
+import itertools
 import math
+import sys
 import typing
 
 from qtpy.QtCore import QPointF, QRectF, Qt
-from qtpy.QtGui import QFontMetrics, QLinearGradient, QPainter, QPen
+from qtpy.QtGui import (QBrush, QColor, QFont, QFontMetrics, QLinearGradient,
+                        QPainter, QPen, QPicture, QPolygonF)
 
 from .enums import NodeValidationState, PortType
 from .node_data import NodeDataModel
@@ -16,6 +20,146 @@ if typing.TYPE_CHECKING:
     from .flow_scene import FlowScene  # noqa
     from .node import Node  # noqa
 
+_TEXT_SIZE_CACHE_SIZE = 4096
+# (font key, text) -> (width, height) of the text's bounding rect
+_text_sizes = {}
+# font key -> bold variant of the font
+_bold_fonts = {}
+
+
+def _bold_font(font: QFont) -> QFont:
+    """
+    Bold variant of `font`, shared between all nodes using the font
+
+    Parameters
+    ----------
+    font : QFont
+
+    Returns
+    -------
+    bold_font : QFont
+        Not to be modified by the caller
+    """
+    key = font.key()
+    try:
+        return _bold_fonts[key]
+    except KeyError:
+        ...
+
+    bold_font = QFont(font)
+    bold_font.setBold(True)
+    _bold_fonts[key] = bold_font
+    return bold_font
+
+
+def _text_size(metrics: QFontMetrics, font_key: str,
+               text: str) -> typing.Tuple[int, int]:
+    """
+    Size of the bounding rect of `text`, cached by font key and text
+
+    Parameters
+    ----------
+    metrics : QFontMetrics
+        Metrics for the font identified by `font_key`
+    font_key : str
+        The `QFont.key()` of the font
+    text : str
+
+    Returns
+    -------
+    width : int
+    height : int
+    """
+    key = (font_key, text)
+    try:
+        return _text_sizes[key]
+    except KeyError:
+        ...
+
+    if len(_text_sizes) >= _TEXT_SIZE_CACHE_SIZE:
+        _text_sizes.clear()
+
+    rect = metrics.boundingRect(text)
+    size = _text_sizes[key] = (rect.width(), rect.height())
+    return size
+
+
+@functools.lru_cache(maxsize=256)
+def _pen(rgba: int, width: float) -> QPen:
+    """
+    Solid pen of the given color and width, shared between paints
+
+    Parameters
+    ----------
+    rgba : int
+        The `QColor.rgba()` value
+    width : float
+
+    Returns
+    -------
+    pen : QPen
+    """
+    return QPen(QColor.fromRgba(rgba), width)
+
+
+@functools.lru_cache(maxsize=256)
+def _point_pen(rgba: int, width: float) -> QPen:
+    """
+    Round-capped pen which draws points as filled circles of diameter `width`
+
+    Parameters
+    ----------
+    rgba : int
+        The `QColor.rgba()` value
+    width : float
+
+    Returns
+    -------
+    pen : QPen
+    """
+    return QPen(QColor.fromRgba(rgba), width, Qt.SolidLine, Qt.RoundCap)
+
+
+@functools.lru_cache(maxsize=256)
+def _brush(rgba: int) -> QBrush:
+    """
+    Solid brush of the given color, shared between paints
+
+    Parameters
+    ----------
+    rgba : int
+        The `QColor.rgba()` value
+
+    Returns
+    -------
+    brush : QBrush
+    """
+    return QBrush(QColor.fromRgba(rgba))
+
+
+@functools.lru_cache(maxsize=256)
+def _node_gradient(stops: tuple, height: float) -> QBrush:
+    """
+    Brush with the node background gradient
+
+    Call ``_node_gradient.cache_clear()`` to drop the cached brushes.
+
+    Parameters
+    ----------
+    stops : tuple
+        (position, rgba) for each gradient stop
+    height : float
+        The node height
+
+    Returns
+    -------
+    brush : QBrush
+    """
+    gradient = QLinearGradient(QPointF(0.0, 0.0), QPointF(2.0, height))
+    for at_, rgba in stops:
+        gradient.setColorAt(at_, QColor.fromRgba(rgba))
+    return QBrush(gradient)
+
 
 class NodePainterDelegate:
     def paint(self, painter: QPainter, geom: NodeGeometry, model: NodeDataModel):
@@ -34,7 +178,8 @@ class NodePainterDelegate:
 class NodePainter:
     @staticmethod
     def paint(painter: QPainter, node: 'Node', scene: 'FlowScene',
-              node_style: NodeStyle, connection_style: ConnectionStyle):
+              node_style: NodeStyle, connection_style: ConnectionStyle,
+              exposed_rect: QRectF = None):
         """
         Paint
 
@@ -45,6 +190,9 @@ class NodePainter:
         scene : FlowScene
         node_style : NodeStyle
         connection_style : ConnectionStyle
+        exposed_rect : QRectF, optional
+            The part of the node that needs repainting, in node coordinates.
+            Text outside of it is not drawn.  Defaults to the whole node.
         """
         geom = node.geometry
         state = node.state
@@ -61,20 +209,96 @@ class NodePainter:
                                    node_style)
         NodePainter.draw_connection_points(painter, geom, state, model, scene,
                                            node_style, connection_style)
-        NodePainter.draw_filled_connection_points(painter, geom, state, model,
-                                                  node_style, connection_style
-                                                  )
-        NodePainter.draw_model_name(painter, geom, state, model, node_style)
-        NodePainter.draw_entry_labels(painter, geom, state, model, node_style)
-        NodePainter.draw_resize_rect(painter, geom, model)
-        NodePainter.draw_validation_rect(painter, geom, model, graphics_object,
-                                         node_style)
+        if exposed_rect is None:
+            NodePainter.draw_model_name(painter, geom, state, model,
+                                        node_style)
+            NodePainter.draw_entry_labels(painter, geom, state, model,
+                                          node_style)
+            NodePainter.draw_resize_rect(painter, geom, model)
+            NodePainter.draw_validation_rect(painter, geom, model,
+                                             graphics_object, node_style)
+        else:
+            # The rects below are conservative bounds of what each draws
+            width, height = geom.width, geom.height
+            entry_height = geom.entry_height
+            caption_height = geom.caption_height
+            diam = node_style.connection_point_diameter
+            if exposed_rect.intersects(
+                    QRectF(0.0, -entry_height, width,
+                           caption_height + 2.0 * entry_height)):
+                NodePainter.draw_model_name(painter, geom, state, model,
+                                            node_style)
+            if exposed_rect.intersects(
+                    QRectF(0.0, caption_height - entry_height, width,
+                           height - caption_height + entry_height)):
+                # The resize rect lies within the labels' bounds
+                NodePainter.draw_entry_labels(painter, geom, state, model,
+                                              node_style)
+                NodePainter.draw_resize_rect(painter, geom, model)
+            # The validation message is always below the caption
+            if exposed_rect.intersects(
+                    QRectF(-diam, caption_height - diam, width + 2.0 * diam,
+                           height - caption_height + 2.0 * diam)):
+                NodePainter.draw_validation_rect(painter, geom, model,
+                                                 graphics_object, node_style)
 
         # call custom painter
         painter_delegate = model.painter_delegate()
         if painter_delegate:
             painter_delegate.paint(painter, geom, model)
 
+    @staticmethod
+    def port_layout(painter: QPainter, geom: NodeGeometry,
+                    state: NodeState, node_style: NodeStyle) -> list:
+        """
+        Positions and labels of all ports
+
+        The layout is cached on the node state until the font, geometry,
+        caption height, connection point diameter or port label texts
+        change.  The points are shared and must not be modified.
+
+        Parameters
+        ----------
+        painter : QPainter
+        geom : NodeGeometry
+        state : NodeState
+        node_style : NodeStyle
+
+        Returns
+        -------
+        layout : list
+            (port, position, label_position, display_text) for each input
+            then output port
+        """
+        font_key = painter.font().key()
+        display_texts = tuple(port.display_text for port in state.ports)
+        key = (font_key, geom.width, geom.height, geom.entry_height,
+               geom.spacing, geom.caption_height,
+               node_style.connection_point_diameter, display_texts)
+        layout = state.label_layout(key)
+        if layout is not None:
+            return layout
+
+        metrics = painter.fontMetrics()
+        width = geom.width
+        layout = []
+        for port_type in (PortType.input, PortType.output):
+            positions = geom.port_positions(port_type)
+            for port, position in zip(state[port_type].values(), positions):
+                # Interned so the text size cache compares by identity
+                display_text = sys.intern(port.display_text)
+                text_width, text_height = _text_size(metrics, font_key,
+                                                     display_text)
+                if port_type == PortType.input:
+                    x = 5.0
+                else:
+                    x = width - 5.0 - text_width
+                label_position = QPointF(x, position.y() + text_height / 4.0)
+                layout.append((port, position, label_position, display_text))
+
+        state.set_label_layout(key, layout)
+        return layout
+
     @staticmethod
     def draw_node_rect(painter: QPainter, geom: NodeGeometry,
                        model: NodeDataModel,
@@ -95,16 +319,13 @@ class NodePainter:
                  if graphics_object.isSelected()
                  else node_style.normal_boundary_color
                  )
-        p = QPen(color, (node_style.hovered_pen_width
-                         if geom.hovered
-                         else node_style.pen_width))
-        painter.setPen(p)
+        painter.setPen(_pen(color.rgba(), (node_style.hovered_pen_width
+                                           if geom.hovered
+                                           else node_style.pen_width)))
 
-        gradient = QLinearGradient(QPointF(0.0, 0.0),
-                                   QPointF(2.0, geom.height))
-        for at_, color in node_style.gradient_colors:
-            gradient.setColorAt(at_, color)
-        painter.setBrush(gradient)
+        stops = tuple((at_, color.rgba())
+                      for at_, color in node_style.gradient_colors)
+        painter.setBrush(_node_gradient(stops, geom.height))
 
         diam = node_style.connection_point_diameter
         boundary = QRectF(-diam,
@@ -132,17 +353,19 @@ class NodePainter:
         if not model.caption_visible:
             return
         name = model.caption
-        f = painter.font()
-        f.setBold(True)
-        metrics = QFontMetrics(f)
-        rect = metrics.boundingRect(name)
-        position = QPointF((geom.width - rect.width()) / 2.0,
-                           (geom.spacing + geom.entry_height) / 3.0)
-        painter.setFont(f)
+        bold_font = _bold_font(painter.font())
+        # The pen is deliberately left set for the following draw calls
         painter.setPen(node_style.font_color)
-        painter.drawText(position, name)
-        f.setBold(False)
-        painter.setFont(f)
+        painter.save()
+        try:
+            painter.setFont(bold_font)
+            width, _ = _text_size(painter.fontMetrics(), bold_font.key(),
+                                  name)
+            position = QPointF((geom.width - width) / 2.0,
+                               (geom.spacing + geom.entry_height) / 3.0)
+            painter.drawText(position, name)
+        finally:
+            painter.restore()
 
     @staticmethod
     def draw_entry_labels(painter: QPainter, geom: NodeGeometry,
@@ -151,6 +374,9 @@ class NodePainter:
         """
         Draw entry labels
 
+        The labels are recorded to a QPicture on the node state and replayed
+        until the layout, the connected ports or the font colors change.
+
         Parameters
         ----------
         painter : QPainter
@@ -159,24 +385,31 @@ class NodePainter:
         model : NodeDataModel
         node_style : NodeStyle
         """
-        metrics = painter.fontMetrics()
-
-        for port in state.ports:
-            scene_pos = port.scene_position
-            if not port.connections:
-                painter.setPen(node_style.font_color_faded)
-            else:
-                painter.setPen(node_style.font_color)
-
-            display_text = port.display_text
-            rect = metrics.boundingRect(display_text)
-            scene_pos.setY(scene_pos.y() + rect.height() / 4.0)
-            if port.port_type == PortType.input:
-                scene_pos.setX(5.0)
-            elif port.port_type == PortType.output:
-                scene_pos.setX(geom.width - 5.0 - rect.width())
+        layout = NodePainter.port_layout(painter, geom, state, node_style)
+        if not layout:
+            return
 
-            painter.drawText(scene_pos, display_text)
+        font_color = node_style.font_color
+        font_color_faded = node_style.font_color_faded
+        connected = tuple(port.has_connections for port, *_ in layout)
+        key = (state.label_layout_key, connected, font_color.rgba(),
+               font_color_faded.rgba())
+        picture = state.label_picture(key)
+        if picture is None:
+            picture = QPicture()
+            picture_painter = QPainter(picture)
+            picture_painter.setFont(painter.font())
+            for (_, _, label_position, display_text), has_connections in zip(
+                    layout, connected):
+                picture_painter.setPen(font_color if has_connections
+                                       else font_color_faded)
+                picture_painter.drawText(label_position, display_text)
+            picture_painter.end()
+            state.set_label_picture(key, picture)
+
+        painter.drawPicture(0, 0, picture)
+        # Leave the pen as drawing the last label would have
+        painter.setPen(font_color if connected[-1] else font_color_faded)
 
     @staticmethod
     def draw_connection_points(painter: QPainter, geom: NodeGeometry,
@@ -185,7 +418,7 @@ class NodePainter:
                                connection_style: ConnectionStyle
                                ):
         """
-        Draw connection points
+        Draw connection points, filling in those with connections
 
         Parameters
         ----------
@@ -194,78 +427,98 @@ class NodePainter:
         state : NodeState
         model : NodeDataModel
         scene : FlowScene
+        node_style : NodeStyle
         connection_style : ConnectionStyle
         """
         diameter = node_style.connection_point_diameter
         reduced_diameter = diameter * 0.6
-        for port in state.ports:
-            scene_pos = port.scene_position
-            can_connect = port.can_connect
-            port_type = port.port_type
-            data_type = port.data_type
-
-            r = 1.0
-            if state.is_reacting and can_connect and port_type == state.reacting_port_type:
-                diff = geom.dragging_pos - scene_pos
-                dist = math.sqrt(QPointF.dotProduct(diff, diff))
-
-                registry = scene.registry
-                dtype1, dtype2 = state.reacting_data_type, data_type
-                if port_type != PortType.input:
-                    dtype2, dtype1 = dtype1, dtype2
-
-                type_convertable = registry.get_type_converter(dtype1, dtype2) is not None
-                if dtype1.id == dtype2.id or type_convertable:
-                    thres = 40.0
-                    r = ((2.0 - dist / thres)
-                         if dist < thres
-                         else 1.0)
-                else:
-                    thres = 80.0
-                    r = ((dist / thres)
-                         if dist < thres
-                         else 1.0)
+        filled_diameter = diameter * 0.8
+        layout = NodePainter.port_layout(painter, geom, state, node_style)
 
-            if connection_style.use_data_defined_colors:
-                brush = connection_style.get_normal_color(data_type.id)
+        if state.is_reacting:
+            radii = NodePainter._reacting_radii(layout, geom, state, scene,
+                                                reduced_diameter)
+        else:
+            # Steady state: all points are drawn at their normal size
+            radii = itertools.repeat(reduced_diameter)
+
+        # Loop invariants
+        use_data_defined_colors = connection_style.use_data_defined_colors
+        get_normal_color = connection_style.get_normal_color
+        point_color = node_style.connection_point_color
+        filled_rgba = node_style.filled_connection_point_color.rgba()
+        set_brush = painter.setBrush
+        draw_ellipse = painter.drawEllipse
+        # rgba -> points of connected ports, filled in one call per color
+        filled_points = {}
+
+        for (port, scene_pos, _, _), radius in zip(layout, radii):
+            if use_data_defined_colors:
+                brush = get_normal_color(port.data_type.id)
             else:
-                brush = node_style.connection_point_color
+                brush = point_color
 
-            painter.setBrush(brush)
-            painter.drawEllipse(scene_pos, reduced_diameter * r, reduced_diameter * r)
+            set_brush(brush)
+            draw_ellipse(scene_pos, radius, radius)
 
-    @staticmethod
-    def draw_filled_connection_points(painter: QPainter, geom: NodeGeometry,
-                                      state: NodeState, model: NodeDataModel,
-                                      node_style: NodeStyle,
-                                      connection_style: ConnectionStyle
-                                      ):
+            if port.has_connections:
+                rgba = brush.rgba() if use_data_defined_colors else filled_rgba
+                filled_points.setdefault(rgba, []).append(scene_pos)
+
+        for rgba, points in filled_points.items():
+            painter.setPen(_point_pen(rgba, filled_diameter))
+            painter.drawPoints(QPolygonF(points))
 
+    @staticmethod
+    def _reacting_radii(layout: list, geom: NodeGeometry, state: NodeState,
+                        scene: 'FlowScene', reduced_diameter: float) -> list:
         """
-        Draw filled connection points
+        Connection point radii while a connection is dragged near the node
 
         Parameters
         ----------
-        painter : QPainter
+        layout : list
+            See `port_layout`
         geom : NodeGeometry
         state : NodeState
-        model : NodeDataModel
-        node_style : NodeStyle
-        connection_style : ConnectionStyle
+        scene : FlowScene
+        reduced_diameter : float
+            The radius of a point at its normal size
+
+        Returns
+        -------
+        radii : list of float
+            One radius per entry in `layout`
         """
-        diameter = node_style.connection_point_diameter
-        for port in state.ports:
-            if not port.connections:
+        reacting_port_type = state.reacting_port_type
+        reacting_data_type = state.reacting_data_type
+        dragging_pos = geom.dragging_pos
+        drag_x, drag_y = dragging_pos.x(), dragging_pos.y()
+        get_type_converter = scene.registry.get_type_converter
+
+        radii = []
+        for port, scene_pos, _, _ in layout:
+            port_type = port.port_type
+            if port_type != reacting_port_type or not port.can_connect:
+                radii.append(reduced_diameter)
                 continue
 
-            scene_pos = port.scene_position
-            if connection_style.use_data_defined_colors:
-                c = connection_style.get_normal_color(port.data_type.id)
+            dist = math.hypot(drag_x - scene_pos.x(), drag_y - scene_pos.y())
+
+            dtype1, dtype2 = reacting_data_type, port.data_type
+            if port_type != PortType.input:
+                dtype2, dtype1 = dtype1, dtype2
+
+            # Compatible ports grow as the drag approaches (up to 2x within
+            # 40 units); others shrink (within 80 units)
+            if (dtype1.id == dtype2.id or
+                    get_type_converter(dtype1, dtype2) is not None):
+                r = max(1.0, 2.0 - dist / 40.0)
             else:
-                c = node_style.filled_connection_point_color
-            painter.setPen(c)
-            painter.setBrush(c)
-            painter.drawEllipse(scene_pos, diameter * 0.4, diameter * 0.4)
+                r = min(1.0, dist / 80.0)
+            radii.append(reduced_diameter * r)
+
+        return radii
 
     @staticmethod
     def draw_resize_rect(painter: QPainter, geom: NodeGeometry, model: NodeDataModel):
@@ -307,17 +560,17 @@ class NodePainter:
                  else node_style.normal_boundary_color)
 
         if geom.hovered:
-            p = QPen(color, node_style.hovered_pen_width)
+            p = _pen(color.rgba(), node_style.hovered_pen_width)
         else:
-            p = QPen(color, node_style.pen_width)
+            p = _pen(color.rgba(), node_style.pen_width)
 
         painter.setPen(p)
 
         # Drawing the validation message background
         if model_validation_state == NodeValidationState.error:
-            painter.setBrush(node_style.error_color)
+            painter.setBrush(_brush(node_style.error_color.rgba()))
         else:
-            painter.setBrush(node_style.warning_color)
+            painter.setBrush(_brush(node_style.warning_color.rgba()))
 
         radius = 3.0
         diam = node_style.connection_point_diameter
@@ -332,13 +585,11 @@ class NodePainter:
 
         # Drawing the validation message itself
         error_msg = model.validation_message()
-        f = painter.font()
-        metrics = QFontMetrics(f)
-        rect = metrics.boundingRect(error_msg)
+        width, _ = _text_size(painter.fontMetrics(), painter.font().key(),
+                              error_msg)
         position = QPointF(
-            (geom.width - rect.width()) / 2.0,
+            (geom.width - width) / 2.0,
             geom.height - (geom.validation_height - diam) / 2.0
         )
-        painter.setFont(f)
         painter.setPen(node_style.font_color)
         painter.drawText(position, error_msg)
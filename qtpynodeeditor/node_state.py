@@ -1,5 +1,8 @@
 import typing
 from collections import OrderedDict
+from itertools import chain
+
+from qtpy.QtGui import QPicture
 
 from .enums import ReactToConnectionState
 from .node_data import NodeDataType
@@ -18,22 +21,25 @@ class NodeState:
         ----------
         model : NodeDataModel
         '''
-        self._ports = {PortType.input: OrderedDict(),
-                       PortType.output: OrderedDict()
-                       }
-
         model = node.model
-        for port_type in self._ports:
-            num_ports = model.num_ports[port_type]
-            self._ports[port_type] = OrderedDict(
+        self._ports = {
+            port_type: OrderedDict(
                 (i, Port(node, port_type=port_type, index=i))
-                for i in range(num_ports)
+                for i in range(model.num_ports[port_type])
             )
+            for port_type in (PortType.input, PortType.output)
+        }
 
         self._reaction = ReactToConnectionState.not_reacting
         self._reacting_port_type = PortType.none
         self._reacting_data_type = None
         self._resizing = False
+        # (layout key, port layout) of the last paint; see
+        # NodePainter.port_layout
+        self._label_cache = None
+        # (key, QPicture) of the last drawn entry labels; see
+        # NodePainter.draw_entry_labels
+        self._label_picture = None
 
     def __getitem__(self, key):
         return self._ports[key]
@@ -45,34 +51,31 @@ class NodeState:
 
     @property
     def input_ports(self):
-        yield from self[PortType.input].values()
+        yield from self._ports[PortType.input].values()
 
     @property
     def output_ports(self):
-        yield from self[PortType.output].values()
+        yield from self._ports[PortType.output].values()
 
     @property
     def output_connections(self):
         """All output connections"""
-        return [
-            connection
-            for idx, port in self._ports[PortType.output].items()
-            for connection in port.connections
-        ]
+        return list(chain.from_iterable(
+            port._connections
+            for port in self._ports[PortType.output].values()))
 
     @property
     def input_connections(self):
         """All input connections"""
-        return [
-            connection
-            for idx, port in self._ports[PortType.input].items()
-            for connection in port.connections
-        ]
+        return list(chain.from_iterable(
+            port._connections
+            for port in self._ports[PortType.input].values()))
 
     @property
     def all_connections(self):
         """All input and output connections"""
-        return self.input_connections + self.output_connections
+        return list(chain.from_iterable(
+            port._connections for port in self.ports))
 
     def connections(self, port_type: PortType, port_index: int) -> list:
         """
@@ -87,7 +90,7 @@ class NodeState:
         -------
         value : list
         """
-        return list(self._ports[port_type][port_index].connections)
+        return self._ports[port_type][port_index].connections
 
     def erase_connection(self, port_type: PortType, port_index: int, connection: 'Connection'):
         """
@@ -175,3 +178,75 @@ class NodeState:
     @resizing.setter
     def resizing(self, resizing: bool):
         self._resizing = resizing
+
+    @property
+    def label_layout_key(self):
+        """
+        Key of the cached port label layout, or None if there is none
+
+        Returns
+        -------
+        value : tuple or None
+        """
+        cache = self._label_cache
+        return cache[0] if cache is not None else None
+
+    def label_layout(self, key) -> typing.Optional[list]:
+        """
+        Port label layout cached for the painter
+
+        Parameters
+        ----------
+        key : tuple
+            Describes the font and geometry the layout was computed for
+
+        Returns
+        -------
+        layout : list or None
+            The cached layout, or None if it was computed for another key
+        """
+        cache = self._label_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        return None
+
+    def set_label_layout(self, key, layout: list):
+        """
+        Cache the port label layout computed by the painter
+
+        Parameters
+        ----------
+        key : tuple
+        layout : list
+        """
+        self._label_cache = (key, layout)
+
+    def label_picture(self, key) -> typing.Optional[QPicture]:
+        """
+        Recorded port label drawing cached for the painter
+
+        Parameters
+        ----------
+        key : tuple
+            Describes the layout, connection state and colors of the labels
+
+        Returns
+        -------
+        picture : QPicture or None
+            The cached picture, or None if it was recorded for another key
+        """
+        cache = self._label_picture
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        return None
+
+    def set_label_picture(self, key, picture: QPicture):
+        """
+        Cache the recorded port label drawing
+
+        Parameters
+        ----------
+        key : tuple
+        picture : QPicture
+        """
+        self._label_picture = (key, picture)
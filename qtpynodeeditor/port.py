@@ -8,6 +8,13 @@ if typing.TYPE_CHECKING:
     from .connection import Connection  # noqa
 
 
+_OPPOSITE_PORT = {
+    PortType.input: PortType.output,
+    PortType.output: PortType.input,
+    PortType.none: PortType.none,
+}
+
+
 def opposite_port(port: PortType) -> PortType:
     """
     Get the opposite port of `port`.
@@ -16,8 +23,7 @@ def opposite_port(port: PortType) -> PortType:
     ----------
     port : PortType
     """
-    return {PortType.input: PortType.output,
-            PortType.output: PortType.input}.get(port, PortType.none)
+    return _OPPOSITE_PORT.get(port, PortType.none)
 
 
 class Port(QObject):
@@ -43,13 +49,21 @@ class Port(QObject):
         self.port_type = port_type
         self.index = index
         self._connections = []
-        self.opposite_port = {PortType.input: PortType.output,
-                              PortType.output: PortType.input}[self.port_type]
+        # Cached bound `propagate_data` methods; reset when connections change
+        self._propagators = None
+        # Cached on first use when the model's data types are static
+        self._data_type = None
+        self.opposite_port = _OPPOSITE_PORT[self.port_type]
 
     @property
     def connections(self):
         return list(self._connections)
 
+    @property
+    def has_connections(self) -> bool:
+        """Is any connection attached, without copying the connection list"""
+        return bool(self._connections)
+
     @property
     def model(self):
         'The data model associated with the Port'
@@ -68,8 +82,13 @@ class Port(QObject):
     @property
     def can_connect(self):
         'Can this port be connected to?'
-        return (not self._connections or
-                self.connection_policy == ConnectionPolicy.many)
+        if not self._connections:
+            return True
+        # Input ports accept a single connection; only output ports need to
+        # consult the model for their policy.
+        return (self.port_type == PortType.output and
+                self.model.port_out_connection_policy(self.index) ==
+                ConnectionPolicy.many)
 
     @property
     def caption(self):
@@ -84,7 +103,18 @@ class Port(QObject):
     @property
     def data_type(self):
         'The NodeData type associated with the Port'
-        return self.model.data_type[self.port_type][self.index]
+        data_type = self._data_type
+        if data_type is not None:
+            return data_type
+
+        model = self.model
+        data_type = model.data_type[self.port_type][self.index]
+        # Only a class-level dictionary is known to be static; a property or
+        # per-instance value may change with the state of the model
+        if (isinstance(getattr(type(model), 'data_type', None), dict) and
+                'data_type' not in model.__dict__):
+            self._data_type = data_type
+        return data_type
 
     @property
     def display_text(self):
@@ -107,6 +137,7 @@ class Port(QObject):
             raise ValueError('Connection already in list')
 
         self._connections.append(connection)
+        self._propagators = None
         self.connection_created.emit(connection)
 
     def remove_connection(self, connection: 'Connection'):
@@ -117,8 +148,29 @@ class Port(QObject):
             # TODO: should not be reaching this
             ...
         else:
+            self._propagators = None
             self.connection_deleted.emit(connection)
 
+    def propagate_data(self, node_data):
+        """
+        Propagate data along all connections of this port.
+
+        The per-connection dispatch is cached until a connection is added to
+        or removed from the port.
+
+        Parameters
+        ----------
+        node_data : NodeData
+        """
+        propagators = self._propagators
+        if propagators is None:
+            propagators = self._propagators = tuple(
+                conn.propagate_data for conn in self._connections
+            )
+
+        for propagate in propagators:
+            propagate(node_data)
+
     @property
     def scene_position(self):
         '''
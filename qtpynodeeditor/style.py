@@ -1,9 +1,14 @@
-import json
+import functools
 import logging
-import random
+import zlib
 
 from qtpy.QtGui import QColor
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,11 +21,38 @@ def _get_qcolor(style_dict, key):
         color = QColor(*name_or_list)
     else:
         color = QColor(name_or_list)
-    logger.debug('Loaded color %s = %s -> %d %d %d %d', key, name_or_list,
-                 *color.getRgb())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Loaded color %s = %s -> %d %d %d %d', key,
+                     name_or_list, *color.getRgb())
     return color
 
 
+def _get_float(style_dict, key):
+    value = style_dict[key]
+    # JSON numbers are usually floats already
+    return value if value.__class__ is float else float(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _data_type_color(type_id: str) -> QColor:
+    """
+    Color derived from a data type id; the same id always gives the same color
+
+    Parameters
+    ----------
+    type_id : str
+
+    Returns
+    -------
+    color : QColor
+        Shared between callers, and not to be modified
+    """
+    h = zlib.crc32(str(type_id).encode('utf-8'))
+    hue = h % 256
+    sat = 120 + (h >> 8) % 129
+    return QColor.fromHsl(hue, sat, 160)
+
+
 class Style:
     default_style = {
         "FlowViewStyle": {
@@ -75,12 +107,12 @@ class Style:
 
         Parameters
         ----------
-        json_style : str or dict
+        json_style : str, bytes or dict
         """
         if isinstance(json_style, dict):
             return json_style
         else:
-            return json.loads(json_style)
+            return _json_loads(json_style)
 
 
 class FlowViewStyle(Style):
@@ -96,7 +128,7 @@ class FlowViewStyle(Style):
 
         Parameters
         ----------
-        json_style : str or dict
+        json_style : str, bytes or dict
         """
         doc = super().load_from_json(json_style)
         style = doc["FlowViewStyle"]
@@ -143,7 +175,7 @@ class ConnectionStyle(Style):
 
         Parameters
         ----------
-        json_style : str
+        json_style : str, bytes or dict
         """
         doc = super().load_from_json(json_style)
         style = doc["ConnectionStyle"]
@@ -153,9 +185,9 @@ class ConnectionStyle(Style):
         self.selected_halo_color = _get_qcolor(style, 'SelectedHaloColor')
         self.hovered_color = _get_qcolor(style, 'HoveredColor')
 
-        self.line_width = float(style['LineWidth'])
-        self.construction_line_width = float(style['ConstructionLineWidth'])
-        self.point_diameter = float(style['PointDiameter'])
+        self.line_width = _get_float(style, 'LineWidth')
+        self.construction_line_width = _get_float(style, 'ConstructionLineWidth')
+        self.point_diameter = _get_float(style, 'PointDiameter')
         self.use_data_defined_colors = bool(style['UseDataDefinedColors'])
 
     def get_normal_color(self, type_id: str = None) -> QColor:
@@ -172,12 +204,8 @@ class ConnectionStyle(Style):
         """
         if type_id is None:
             return self.normal_color
-
-        hue_range = 0xFF
-        random.seed(type_id)
-        hue = random.randint(0, hue_range)
-        sat = 120 + id(type_id) % 129
-        return QColor.fromHsl(hue, sat, 160)
+        # The cached color is shared; callers get their own copy
+        return QColor(_data_type_color(type_id))
 
 
 class NodeStyle(Style):
@@ -208,7 +236,7 @@ class NodeStyle(Style):
 
         Parameters
         ----------
-        json_style : str
+        json_style : str, bytes or dict
         """
         doc = super().load_from_json(json_style)
         style = doc["NodeStyle"]
@@ -232,11 +260,10 @@ class NodeStyle(Style):
         self.warning_color = _get_qcolor(style, 'WarningColor')
         self.error_color = _get_qcolor(style, 'ErrorColor')
 
-        self.pen_width = float(style['PenWidth'])
-        self.hovered_pen_width = float(style['HoveredPenWidth'])
-        self.connection_point_diameter = float(
-            style['ConnectionPointDiameter'])
-        self.opacity = float(style['Opacity'])
+        self.pen_width = _get_float(style, 'PenWidth')
+        self.hovered_pen_width = _get_float(style, 'HoveredPenWidth')
+        self.connection_point_diameter = _get_float(style, 'ConnectionPointDiameter')
+        self.opacity = _get_float(style, 'Opacity')
 
 
 class StyleCollection:
@@ -257,10 +284,19 @@ class StyleCollection:
 
     @classmethod
     def from_json(cls, json_doc):
+        """
+        Create all styles from a single JSON document
+
+        Parameters
+        ----------
+        json_doc : str, bytes or dict
+            The document, or its raw UTF-8 bytes as read from a file opened
+            in binary mode
+        """
         if isinstance(json_doc, dict):
             json_style = json_doc
         else:
-            json_style = json.loads(json_doc)
+            json_style = _json_loads(json_doc)
 
         return StyleCollection(
             node=NodeStyle(json_style),
@@ -269,4 +305,10 @@ class StyleCollection:
         )
 
 
-default_style = StyleCollection()
+def __getattr__(name):
+    # The module-level ``default_style`` is only created on first use
+    if name == 'default_style':
+        global default_style
+        default_style = StyleCollection()
+        return default_style
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
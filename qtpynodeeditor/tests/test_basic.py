@@ -1,7 +1,11 @@
+import gc
+import sys
 import unittest.mock
 
 import pytest
 import qtpy.QtCore
+import qtpy.QtGui
+import qtpy.QtWidgets
 
 import qtpynodeeditor as nodeeditor
 from qtpynodeeditor import PortType
@@ -223,6 +227,7 @@ def test_smoke_reacting(scene, view, model, reset, port_type):
         scene_point=qtpy.QtCore.QPointF(0, 0),
     )
     view.update()
+    _render(scene)
     if reset:
         node.reset_reaction_to_connection()
 
@@ -387,3 +392,866 @@ def test_smoke_scene_signal_nodes(scene, view, model):
     scene.remove_node(node1)
     scene.remove_node(node2)
     assert mock.call_count == 2
+
+
+def test_port_can_connect(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    in_port = node1[PortType.input][0]
+    out_port = node2[PortType.output][0]
+    assert in_port.can_connect
+    assert out_port.can_connect
+    assert not in_port.has_connections
+
+    scene.create_connection(out_port, in_port)
+    # Input ports take a single connection; output ports default to many
+    assert not in_port.can_connect
+    assert out_port.can_connect
+    assert in_port.has_connections and out_port.has_connections
+
+
+def test_node_data_same_type():
+    class MyNodeDataCopy(nodeeditor.NodeData):
+        data_type = nodeeditor.NodeDataType(''.join(['My', 'NodeData']),
+                                            'Copy')
+
+    assert MyNodeData().same_type(MyNodeData())
+    assert MyNodeData().same_type(MyNodeDataCopy())
+    assert not MyNodeData().same_type(MyOtherNodeData())
+
+    class PropertyNodeData(nodeeditor.NodeData):
+        @property
+        def data_type(self):
+            return MyOtherNodeData.data_type
+
+    assert PropertyNodeData().same_type(MyOtherNodeData())
+
+    data = MyNodeData()
+    data.data_type = MyOtherNodeData.data_type
+    assert not data.same_type(MyNodeData())
+    assert data.same_type(MyOtherNodeData())
+
+
+def test_connection_interaction_deleted_node(scene, view, model):
+    node1 = scene.create_node(model)
+    conn = scene.create_connection(node1[PortType.output][0])
+    node2 = nodeeditor.Node(model())
+    interaction = nodeeditor.NodeConnectionInteraction(
+        node=node2, connection=conn, scene=scene)
+
+    del node2
+    gc.collect()
+    with pytest.raises(nodeeditor.NodeConnectionFailure):
+        interaction.can_connect()
+    assert not interaction.try_connect()
+    with pytest.raises(nodeeditor.NodeConnectionFailure):
+        interaction.disconnect(PortType.input)
+
+
+def test_jit_without_numba(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numba', None)
+
+    def kernel(value):
+        return value * 2
+
+    assert nodeeditor.jit(kernel) is kernel
+    assert nodeeditor.jit(nopython=True)(kernel) is kernel
+
+
+def test_port_propagate_data(scene, model):
+    source = scene.create_node(model)
+    target1 = scene.create_node(model)
+    target2 = scene.create_node(model)
+    out_port = source[PortType.output][0]
+    conn1 = scene.create_connection(out_port, target1[PortType.input][0])
+    scene.create_connection(out_port, target2[PortType.input][0])
+
+    data = MyNodeData()
+    with unittest.mock.patch.object(target1, 'propagate_data') as prop1, \
+            unittest.mock.patch.object(target2, 'propagate_data') as prop2:
+        source.on_data_updated(out_port)
+        prop1.assert_called_once_with(unittest.mock.ANY,
+                                      target1[PortType.input][0])
+        prop2.assert_called_once()
+
+        # The cached dispatch is reset when the topology changes
+        scene.delete_connection(conn1)
+        prop1.reset_mock()
+        prop2.reset_mock()
+        out_port.propagate_data(data)
+        prop1.assert_not_called()
+        prop2.assert_called_once_with(data, target2[PortType.input][0])
+
+
+def test_connection_end_scene_position(scene, view, model):
+    node = scene.create_node(model)
+    conn = scene.create_connection(node[PortType.output][0])
+    cgo = conn.graphics_object
+    end_point = qtpy.QtCore.QPointF(10, 20)
+    conn.geometry.set_end_point(PortType.input, end_point)
+    assert cgo.end_scene_position(PortType.input) == cgo.mapToScene(end_point)
+
+    cgo.setPos(cgo.pos() + qtpy.QtCore.QPointF(5, 5))
+    assert cgo.end_scene_position(PortType.input) == cgo.mapToScene(end_point)
+
+    conn.geometry.move_end_point(PortType.input, qtpy.QtCore.QPointF(1, 1))
+    assert (cgo.end_scene_position(PortType.input) ==
+            cgo.mapToScene(qtpy.QtCore.QPointF(11, 21)))
+
+
+def test_geometry_caption_size(scene, model):
+    node = scene.create_node(model)
+    geom = node.geometry
+    metrics = geom._bold_font_metrics
+    caption = node.model.caption
+    assert geom.caption_width == metrics.horizontalAdvance(caption)
+    assert geom.caption_height == metrics.boundingRect(caption).height()
+    assert caption in geom._bold_text_widths
+
+    font = qtpy.QtGui.QFont()
+    font.setPointSize(font.pointSize() * 2)
+    geom.recalculate_size(font)
+    bold_font = qtpy.QtGui.QFont(font)
+    bold_font.setBold(True)
+    metrics = qtpy.QtGui.QFontMetrics(bold_font)
+    assert geom.caption_width == metrics.horizontalAdvance(caption)
+    assert geom.caption_height == metrics.boundingRect(caption).height()
+
+
+@pytest.mark.parametrize('port_type', [PortType.input, PortType.output])
+@pytest.mark.parametrize('transform_args', [(), ('rotate', 30.0),
+                                            ('scale', 2.0, 0.5)])
+def test_check_hit_scene_point(scene, model, port_type, transform_args):
+    node = scene.create_node(model)
+    geom = node.geometry
+    transform = qtpy.QtGui.QTransform()
+    transform.translate(30, 40)
+    if transform_args:
+        method, *args = transform_args
+        getattr(transform, method)(*args)
+
+    for idx, port in node[port_type].items():
+        pos = geom.port_scene_position(port_type, idx, transform)
+        assert geom.check_hit_scene_point(port_type, pos, transform) is port
+
+    far_away = qtpy.QtCore.QPointF(-1e5, -1e5)
+    assert geom.check_hit_scene_point(port_type, far_away, transform) is None
+
+
+def test_port_scene_position_cache(scene, model):
+    node = scene.create_node(model)
+    geom = node.geometry
+    pos = geom.port_scene_position(PortType.output, 1)
+    # Callers may modify the returned point
+    pos.setX(-1000)
+    assert geom.port_scene_position(PortType.output, 1).x() != -1000
+
+    geom.width = geom.width + 50
+    new_pos = geom.port_scene_position(PortType.output, 1)
+    assert new_pos.x() == (geom.width +
+                           node.style.connection_point_diameter)
+
+
+def test_calculate_node_position_between_node_ports(scene, model):
+    source = scene.create_node(model)
+    target = scene.create_node(model)
+    new_node = scene.create_node(model)
+    source.position = (0, 0)
+    target.position = (400, 200)
+
+    pos = nodeeditor.NodeGeometry.calculate_node_position_between_node_ports(
+        0, PortType.input, target, 0, PortType.output, source, new_node)
+
+    expected = (
+        source.position
+        + source.geometry.port_scene_position(PortType.output, 0)
+        + target.position
+        + target.geometry.port_scene_position(PortType.input, 0)
+    ) / 2.0
+    expected -= qtpy.QtCore.QPointF(new_node.geometry.width / 2.0,
+                                    new_node.geometry.height / 2.0)
+    assert pos == expected
+
+
+def test_slots(scene, model):
+    node = scene.create_node(model)
+    assert not hasattr(node.geometry, '__dict__')
+    assert not hasattr(nodeeditor.NodeDataType('id', 'name'), '__dict__')
+
+    class SlottedNodeData(nodeeditor.NodeData):
+        __slots__ = ('value', )
+        data_type = nodeeditor.NodeDataType('slotted', 'Slotted')
+
+    assert not hasattr(SlottedNodeData(), '__dict__')
+
+
+@pytest.mark.parametrize('port_type', [PortType.input, PortType.output])
+def test_port_positions(scene, model, port_type):
+    node = scene.create_node(model)
+    geom = node.geometry
+    positions = geom.port_positions(port_type)
+    assert len(positions) == len(node[port_type])
+    for idx, pos in enumerate(positions):
+        assert pos == geom.port_scene_position(port_type, idx)
+
+    with pytest.raises(IndexError):
+        geom.port_scene_position(port_type, -1)
+
+
+def test_port_positions_style_and_caption(scene, model, monkeypatch):
+    node = scene.create_node(model)
+    geom = node.geometry
+    before = geom.port_scene_position(PortType.input, 0)
+
+    monkeypatch.setattr(node.style, 'connection_point_diameter',
+                        node.style.connection_point_diameter + 5)
+    pos = geom.port_scene_position(PortType.input, 0)
+    assert pos.x() == before.x() - 5
+
+    monkeypatch.setattr(node.model, 'caption_visible', False)
+    assert geom.port_scene_position(PortType.input, 0).y() < pos.y()
+
+
+def test_recalculate_size_same_font(scene, model):
+    node = scene.create_node(model)
+    geom = node.geometry
+    font = qtpy.QtGui.QFont()
+    font.setPointSize(font.pointSize() * 2)
+    geom.recalculate_size(font)
+    width = geom.width
+
+    geom.width = 1
+    geom.recalculate_size(qtpy.QtGui.QFont(font))
+    # Unchanged font: the early-out leaves the size alone
+    assert geom.width == 1
+
+    geom.recalculate_size()
+    assert geom.width == width
+
+
+def test_font_metrics_shared(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    assert node1.geometry._bold_font_metrics is node2.geometry._bold_font_metrics
+
+    font = qtpy.QtGui.QFont()
+    font.setPointSize(font.pointSize() * 3)
+    node1.geometry.recalculate_size(font)
+    node2.geometry.recalculate_size(font)
+    assert node1.geometry._font_metrics is node2.geometry._font_metrics
+    assert node1.geometry._bold_font_metrics is node2.geometry._bold_font_metrics
+
+
+def test_widget_position_validation(scene, model):
+    class WarningDataModel(model):
+        name = 'WarningDataModel'
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._widget = qtpy.QtWidgets.QLabel('widget')
+
+        def embedded_widget(self):
+            return self._widget
+
+        def validation_state(self):
+            return nodeeditor.NodeValidationState.warning
+
+        def validation_message(self):
+            return 'Warning message'
+
+    scene.registry.register_model(WarningDataModel, category='My Category')
+    node = scene.create_node(WarningDataModel)
+    geom = node.geometry
+    widget = node.model.embedded_widget()
+    expected_y = (geom.caption_height + geom.height - geom.validation_height -
+                  geom.spacing - widget.height()) / 2.0
+    assert geom.widget_position.y() == expected_y
+    assert geom.equivalent_widget_height() == (
+        geom.height - geom.caption_height + geom.validation_height)
+
+
+def _render(scene):
+    image = qtpy.QtGui.QImage(400, 300, qtpy.QtGui.QImage.Format_ARGB32)
+    painter = qtpy.QtGui.QPainter(image)
+    try:
+        scene.render(painter)
+    finally:
+        painter.end()
+    return image
+
+
+def test_smoke_paint(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    node2.position = (200, 0)
+    scene.create_connection(node1[PortType.output][0],
+                            node2[PortType.input][0])
+    _render(scene)
+
+
+def test_painter_text_size_cache(scene, model):
+    from qtpynodeeditor import node_painter
+    node_painter._text_sizes.clear()
+    scene.create_node(model)
+    _render(scene)
+    assert node_painter._text_sizes
+    with unittest.mock.patch.object(qtpy.QtGui.QFontMetrics,
+                                    'boundingRect') as bounding_rect:
+        _render(scene)
+        assert not bounding_rect.called
+
+
+def test_smoke_paint_validation(scene, model):
+    class ErrorDataModel(model):
+        name = 'ErrorDataModel'
+
+        def validation_state(self):
+            return nodeeditor.NodeValidationState.error
+
+        def validation_message(self):
+            return 'Error message'
+
+    scene.registry.register_model(ErrorDataModel, category='My Category')
+    scene.create_node(ErrorDataModel)
+    _render(scene)
+
+
+def test_painter_bold_font(qapp):
+    from qtpynodeeditor.node_painter import _bold_font
+    font = qtpy.QtGui.QFont('Arial', 10)
+    bold_font = _bold_font(font)
+    assert bold_font.bold()
+    assert not font.bold()
+    assert _bold_font(qtpy.QtGui.QFont('Arial', 10)) is bold_font
+
+
+def test_painter_port_layout(scene, model):
+    node = scene.create_node(model)
+    _render(scene)
+    layout = node.state.label_layout(node.state.label_layout_key)
+    assert [entry[0] for entry in layout] == list(node.state.ports)
+    for port, position, _, display_text in layout:
+        assert position == port.scene_position
+        assert display_text == port.display_text
+
+    # Unchanged geometry reuses the layout
+    _render(scene)
+    assert node.state.label_layout(node.state.label_layout_key) is layout
+
+    node.geometry.width += 10
+    node.graphics_object.update()
+    _render(scene)
+    assert node.state.label_layout(node.state.label_layout_key) is not layout
+
+
+def test_painter_node_gradient(scene, model):
+    from qtpynodeeditor.node_painter import _node_gradient
+    _node_gradient.cache_clear()
+    scene.create_node(model)
+    _render(scene)
+    assert _node_gradient.cache_info().currsize == 1
+    scene.create_node(model)
+    _render(scene)
+    assert _node_gradient.cache_info().currsize == 1
+
+    stops = ((0.0, 0xff000000), (1.0, 0xffffffff))
+    brush = _node_gradient(stops, 10.0)
+    gradient = brush.gradient()
+    assert [(at_, color.rgba()) for at_, color in gradient.stops()] == list(stops)
+
+
+def test_painter_pen_and_brush(qapp):
+    from qtpynodeeditor.node_painter import _brush, _pen
+    color = qtpy.QtGui.QColor(10, 20, 30, 40)
+    pen = _pen(color.rgba(), 2.0)
+    assert pen.color() == color
+    assert pen.widthF() == 2.0
+    assert _pen(color.rgba(), 2.0) is pen
+    assert _brush(color.rgba()).color() == color
+
+
+def test_painter_label_picture(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    state = node1.state
+    with unittest.mock.patch.object(
+            state, 'set_label_picture',
+            wraps=state.set_label_picture) as set_picture:
+        _render(scene)
+        assert set_picture.call_count == 1
+        key, picture = set_picture.call_args[0]
+        assert not picture.isNull()
+        assert state.label_picture(key) is picture
+
+        node1.graphics_object.update()
+        _render(scene)
+        assert set_picture.call_count == 1
+
+        # Connecting a port changes its label color
+        scene.create_connection(node2[PortType.output][0],
+                                node1[PortType.input][0])
+        node1.graphics_object.update()
+        _render(scene)
+        assert set_picture.call_count == 2
+        assert state.label_picture(key) is None
+
+
+def test_painter_labels_follow_port_caption(scene, model):
+    node = scene.create_node(model)
+    state = node.state
+    _render(scene)
+
+    model_ = node.model
+    model_.port_caption = {'input': {0: 'x', 1: 'x', 2: 'x'},
+                           'output': {0: 'x', 1: 'x', 2: 'x'}}
+    model_.port_caption_visible = {'input': {0: True, 1: True, 2: True},
+                                   'output': {0: True, 1: True, 2: True}}
+    # Keep the node size, so that only the label texts differ
+    with unittest.mock.patch.object(
+            state, 'set_label_picture',
+            wraps=state.set_label_picture) as set_picture:
+        node.graphics_object.update()
+        _render(scene)
+        # The labels are recorded again with the new text
+        assert set_picture.call_count == 1
+
+    layout = state.label_layout(state.label_layout_key)
+    assert [entry[3] for entry in layout] == ['x'] * 6
+    for port, position, _, _ in layout:
+        assert position == port.scene_position
+
+
+def test_painter_reacting_radii(scene, model):
+    from qtpynodeeditor.node_painter import NodePainter
+    node = scene.create_node(model)
+    in_port = node[PortType.input][0]
+    node.react_to_possible_connection(
+        reacting_port_type=PortType.input,
+        reacting_data_type=in_port.data_type,
+        scene_point=in_port.get_mapped_scene_position(
+            node.graphics_object.sceneTransform()),
+    )
+    state, geom = node.state, node.geometry
+    layout = [(port, port.scene_position, None, None) for port in state.ports]
+    radii = NodePainter._reacting_radii(layout, geom, state, scene, 3.0)
+    # The port under the drag doubles in size; output ports are unaffected
+    assert radii[0] == 6.0
+    assert radii[len(state[PortType.input]):] == [3.0] * len(state[PortType.output])
+
+
+def test_port_data_type_cached(scene, model):
+    node = scene.create_node(model)
+    port = node[PortType.output][0]
+    data_type = port.data_type
+    assert data_type == node.model.data_type[PortType.output][0]
+    with unittest.mock.patch.object(type(node.model), 'data_type', {}):
+        assert port.data_type is data_type
+
+
+def test_port_data_type_dynamic(scene, model):
+    class DynamicDataModel(model, verify=False):
+        name = 'DynamicDataModel'
+        use_other = False
+
+        @property
+        def data_type(self):
+            data_type = (MyOtherNodeData.data_type if self.use_other
+                         else MyNodeData.data_type)
+            return {port_type: dict.fromkeys(range(count), data_type)
+                    for port_type, count in self.num_ports.items()}
+
+    scene.registry.register_model(DynamicDataModel, category='My Category')
+    node = scene.create_node(DynamicDataModel)
+    port = node[PortType.output][0]
+    assert port.data_type == MyNodeData.data_type
+    node.model.use_other = True
+    assert port.data_type == MyOtherNodeData.data_type
+
+
+def test_painter_filled_connection_points(scene, model):
+    from qtpynodeeditor.node_painter import NodePainter
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    scene.create_connection(node2[PortType.output][0],
+                            node1[PortType.input][0])
+
+    style = node1.model.style
+    image = qtpy.QtGui.QImage(400, 300, qtpy.QtGui.QImage.Format_ARGB32)
+    image.fill(0)
+    painter = qtpy.QtGui.QPainter(image)
+    try:
+        painter.translate(50, 50)
+        NodePainter.draw_connection_points(
+            painter, node1.geometry, node1.state, node1.model, scene,
+            style.node, style.connection)
+    finally:
+        painter.end()
+
+    def color_at(port):
+        pos = port.scene_position
+        return image.pixelColor(int(pos.x()) + 50, int(pos.y()) + 50)
+
+    assert color_at(node1[PortType.input][0]) == (
+        style.node.filled_connection_point_color)
+    assert color_at(node1[PortType.input][1]) != (
+        style.node.filled_connection_point_color)
+
+
+def test_painter_exposed_rect(scene, model):
+    from qtpynodeeditor.node_painter import NodePainter
+    node = scene.create_node(model)
+    geom = node.geometry
+    style = node.model.style
+
+    image = qtpy.QtGui.QImage(400, 300, qtpy.QtGui.QImage.Format_ARGB32)
+    painter = qtpy.QtGui.QPainter(image)
+    try:
+        with unittest.mock.patch.object(NodePainter, 'draw_model_name') as name, \
+                unittest.mock.patch.object(NodePainter, 'draw_entry_labels') as labels:
+            # Only the bottom of the node is exposed
+            exposed = qtpy.QtCore.QRectF(0, geom.height - 2, geom.width, 2)
+            NodePainter.paint(painter, node, scene, style.node,
+                              style.connection, exposed_rect=exposed)
+            assert not name.called
+            assert labels.called
+
+            NodePainter.paint(painter, node, scene, style.node,
+                              style.connection)
+            assert name.called
+    finally:
+        painter.end()
+
+
+def test_style_from_json_string(qapp):
+    import json
+    doc = json.loads(json.dumps(nodeeditor.style.Style.default_style))
+    doc['NodeStyle']['FontColor'] = [1, 2, 3]
+    style = nodeeditor.StyleCollection.from_json(json.dumps(doc))
+    assert style.node.font_color == qtpy.QtGui.QColor(1, 2, 3)
+    assert nodeeditor.NodeStyle(json.dumps(doc)).font_color == (
+        qtpy.QtGui.QColor(1, 2, 3))
+
+    raw = json.dumps(doc).encode('utf-8')
+    style = nodeeditor.StyleCollection.from_json(raw)
+    assert style.node.font_color == qtpy.QtGui.QColor(1, 2, 3)
+    assert nodeeditor.NodeStyle(raw).font_color == qtpy.QtGui.QColor(1, 2, 3)
+
+
+def test_style_get_qcolor(qapp):
+    from qtpynodeeditor.style import _get_qcolor
+    style = {'a': 'cyan', 'b': [1, 2, 3]}
+    color = _get_qcolor(style, 'a')
+    assert color == qtpy.QtGui.QColor('cyan')
+    assert _get_qcolor(style, 'b') == qtpy.QtGui.QColor(1, 2, 3)
+    assert not _get_qcolor(style, 'missing').isValid()
+
+    # Each call parses a new color
+    color.setRed(0)
+    assert _get_qcolor(style, 'a') == qtpy.QtGui.QColor('cyan')
+
+
+def test_style_data_type_color(qapp):
+    style = nodeeditor.ConnectionStyle()
+    color = style.get_normal_color('decimal')
+    # Equal ids give equal colors, regardless of string identity
+    assert style.get_normal_color(''.join(['dec', 'imal'])) == color
+    assert style.get_normal_color('integer') != color
+
+    # Modifying a returned color does not affect later callers
+    color.setAlpha(0)
+    assert style.get_normal_color('decimal').alpha() == 255
+    assert style.get_normal_color() is style.normal_color
+
+
+def test_style_collection_attributes(qapp):
+    style = nodeeditor.StyleCollection()
+    assert isinstance(style.node, nodeeditor.NodeStyle)
+    # Styles accept additional user-defined attributes
+    for sub_style in (style, style.node, style.connection, style.flow_view):
+        sub_style.custom = 2
+        assert sub_style.custom == 2
+
+
+def test_style_float_values(qapp):
+    import copy
+    doc = copy.deepcopy(nodeeditor.style.Style.default_style)
+    doc['NodeStyle']['PenWidth'] = 2
+    style = nodeeditor.NodeStyle(doc)
+    assert style.pen_width == 2.0
+    assert isinstance(style.pen_width, float)
+    assert style.opacity == doc['NodeStyle']['Opacity']
+
+
+def test_type_converter_convert():
+    TypeConverter = nodeeditor.type_converter.TypeConverter
+
+    def func(x):
+        return x + 1
+
+    converter = TypeConverter(None, None, func)
+    assert converter.convert is func
+    assert converter(1) == 2
+
+    class CustomConverter(TypeConverter):
+        def __call__(self, input):
+            return self.func(input) * 10
+
+    converter = CustomConverter(None, None, func)
+    assert converter.convert is converter
+    assert converter.convert(1) == 20
+
+
+def test_type_converter_id():
+    type_converter = nodeeditor.type_converter
+    converter = type_converter.TypeConverter(MyNodeData.data_type,
+                                             MyOtherNodeData.data_type,
+                                             lambda x: x)
+    assert converter.id == type_converter.TypeConverterId(
+        MyNodeData.data_type, MyOtherNodeData.data_type)
+    assert converter.id == (MyNodeData.data_type, MyOtherNodeData.data_type)
+    assert converter.id.type_in is converter.type_in
+    assert hash(converter.id) == hash(
+        (MyNodeData.data_type, MyOtherNodeData.data_type))
+
+    # Converters remain TypeConverterIds, but compare by identity
+    assert isinstance(converter, type_converter.TypeConverterId)
+    type_in, type_out = converter
+    assert (type_in, type_out) == converter.id
+    other = type_converter.TypeConverter(type_in, type_out, lambda x: x)
+    assert converter != other
+    assert len({converter, other}) == 2
+
+
+def test_default_style_lazy(qapp):
+    style_module = nodeeditor.style
+    default_style = style_module.default_style
+    assert isinstance(default_style, nodeeditor.StyleCollection)
+    assert style_module.default_style is default_style
+    with pytest.raises(AttributeError):
+        style_module.no_such_attribute
+
+
+def test_connection_ports(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    out_port = node1[PortType.output][0]
+    in_port = node2[PortType.input][0]
+
+    partial = nodeeditor.Connection(out_port, style=scene.style_collection)
+    assert partial.ports == (None, out_port)
+    assert partial.valid_ports == {PortType.output: out_port}
+    assert not partial.is_complete
+    assert partial.data_type(PortType.input) == out_port.data_type
+    assert partial.get_node(PortType.input) is None
+
+    conn = scene.create_connection(out_port, in_port)
+    assert conn.ports == (in_port, out_port)
+    assert conn.is_complete
+    assert conn.data_type(PortType.input) == in_port.data_type
+    assert conn.data_type(PortType.output) == out_port.data_type
+    assert conn.valid_ports == {PortType.input: in_port,
+                                PortType.output: out_port}
+
+    partial.connect_to(in_port)
+    assert partial.ports == (in_port, out_port)
+    partial.clear_node(PortType.output)
+    assert partial.ports == (in_port, None)
+    assert partial.nodes == (node2, None)
+    assert conn.nodes == (node2, node1)
+
+
+def test_connection_getstate_converter(scene, model, other_model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(other_model)
+    converter = nodeeditor.type_converter.TypeConverter(
+        MyNodeData.data_type, MyOtherNodeData.data_type, lambda x: None)
+    scene.registry.register_type_converter(
+        MyNodeData.data_type, MyOtherNodeData.data_type, converter)
+    conn = scene.create_connection(node1[PortType.output][0],
+                                   node2[PortType.input][0])
+    state = conn.__getstate__()
+    assert state['in_id'] == node2.id
+    assert state['out_id'] == node1.id
+    assert state['converter'] == {
+        'in': dict(id=MyOtherNodeData.data_type.id,
+                   name=MyOtherNodeData.data_type.name),
+        'out': dict(id=MyNodeData.data_type.id,
+                    name=MyNodeData.data_type.name),
+    }
+
+
+def test_connection_geometry_cache():
+    geom = nodeeditor.ConnectionGeometry(nodeeditor.StyleCollection())
+    assert not hasattr(geom, '__dict__')
+    geom.set_end_point(PortType.output, qtpy.QtCore.QPointF(0, 0))
+    geom.set_end_point(PortType.input, qtpy.QtCore.QPointF(100, 50))
+    rect = geom.bounding_rect
+    c1, c2 = geom.points_c1_c2()
+    assert geom.bounding_rect == rect
+    assert geom.points_c1_c2() == (c1, c2)
+
+    # Returned values are copies and may be modified by the caller
+    rect.setWidth(0)
+    c1.setX(-1)
+    assert geom.bounding_rect != rect
+    assert geom.points_c1_c2()[0] != c1
+
+    geom.move_end_point(PortType.input, qtpy.QtCore.QPointF(50, 0))
+    assert geom.bounding_rect.right() > rect.right() + 50
+
+    # Points modified in place are picked up as well
+    geom.get_end_point(PortType.output).setY(-200)
+    assert geom.bounding_rect.top() < -200
+    assert geom.points_c1_c2()[0].y() == -200
+
+
+def test_connection_made_incomplete_direct(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    conn = scene.create_connection(node2[PortType.input][0],
+                                   node1[PortType.output][0])
+    deleted = []
+    incomplete = []
+    scene.connection_deleted.connect(deleted.append)
+    conn.connection_made_incomplete.connect(incomplete.append)
+    # Handled synchronously, without waiting on the event loop
+    conn.clear_node(PortType.input)
+    assert deleted == [conn]
+    assert incomplete == [conn]
+
+
+def test_scene_connections_order(scene, model):
+    nodes = [scene.create_node(model) for _ in range(4)]
+    conns = [
+        scene.create_connection(nodes[i + 1][PortType.input][0],
+                                nodes[i][PortType.output][0])
+        for i in range(3)
+    ]
+    assert scene.connections == conns
+    scene.delete_connection(conns[1])
+    assert scene.connections == [conns[0], conns[2]]
+    # Deleting twice is a no-op
+    scene.delete_connection(conns[1])
+    scene.clear_scene()
+    assert scene.connections == []
+
+
+def test_connection_id_lazy(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    conn = scene.create_connection(node2[PortType.input][0],
+                                   node1[PortType.output][0])
+    assert conn._uid is None
+    uid = conn.id
+    assert isinstance(uid, str) and len(uid) == 36
+    assert conn.id == uid
+    assert sys.intern(uid) is uid
+
+
+def test_connection_geometry_set_points():
+    geom = nodeeditor.ConnectionGeometry(nodeeditor.StyleCollection())
+    geom.set_in_point(qtpy.QtCore.QPointF(100, 50))
+    geom.set_out_point(qtpy.QtCore.QPointF(0, 0))
+    rect = geom.bounding_rect
+    geom.move_in_point(qtpy.QtCore.QPointF(10, 0))
+    geom.move_out_point(qtpy.QtCore.QPointF(0, -10))
+    assert geom.sink == qtpy.QtCore.QPointF(110, 50)
+    assert geom.source == qtpy.QtCore.QPointF(0, -10)
+    assert geom.bounding_rect != rect
+
+    with pytest.raises(ValueError):
+        geom.set_end_point(PortType.none, qtpy.QtCore.QPointF())
+
+
+def test_connection_painter_path_cache():
+    from qtpynodeeditor.connection_painter import ConnectionPainter, cubic_path
+    geom = nodeeditor.ConnectionGeometry(nodeeditor.StyleCollection())
+    geom.set_out_point(qtpy.QtCore.QPointF(0, 0))
+    geom.set_in_point(qtpy.QtCore.QPointF(100, 50))
+
+    cubic = cubic_path(geom)
+    stroke = ConnectionPainter.get_painter_stroke(geom)
+    assert cubic_path(geom) == cubic
+    assert ConnectionPainter.get_painter_stroke(geom) == stroke
+
+    # Callers get copies of the cached paths
+    cubic.lineTo(500, 500)
+    assert cubic_path(geom) != cubic
+
+    geom.move_in_point(qtpy.QtCore.QPointF(0, 100))
+    assert cubic_path(geom).currentPosition() == qtpy.QtCore.QPointF(100, 150)
+    assert ConnectionPainter.get_painter_stroke(geom) != stroke
+
+
+def test_smoke_paint_gradient_connection(scene, model, other_model,
+                                         monkeypatch):
+    monkeypatch.setattr(scene.style_collection.connection,
+                        'use_data_defined_colors', True)
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(other_model)
+    node2.position = (250, 0)
+    converter = nodeeditor.type_converter.TypeConverter(
+        MyNodeData.data_type, MyOtherNodeData.data_type, lambda x: None)
+    scene.registry.register_type_converter(
+        MyNodeData.data_type, MyOtherNodeData.data_type, converter)
+    conn = scene.create_connection(node1[PortType.output][0],
+                                   node2[PortType.input][0])
+    _render(scene)
+    conn.graphics_object.setSelected(True)
+    _render(scene)
+
+
+def test_connection_painter_stroke_contains_curve():
+    from qtpynodeeditor.connection_painter import ConnectionPainter, cubic_path
+    geom = nodeeditor.ConnectionGeometry(nodeeditor.StyleCollection())
+    geom.set_out_point(qtpy.QtCore.QPointF(0, 0))
+    geom.set_in_point(qtpy.QtCore.QPointF(-100, 80))
+    cubic = cubic_path(geom)
+    stroke = ConnectionPainter.get_painter_stroke(geom)
+    for i in range(21):
+        assert stroke.contains(cubic.pointAtPercent(i / 20))
+    assert not stroke.contains(qtpy.QtCore.QPointF(-50, 300))
+
+
+def test_locate_node_at_topmost(scene, view, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    node1.position = node2.position = (0, 0)
+    node1.graphics_object.setZValue(1)
+    node2.graphics_object.setZValue(2)
+    point = qtpy.QtCore.QPointF(5, 5)
+    assert scene.locate_node_at(point, view.transform()) is node2
+    assert scene.locate_node_at(qtpy.QtCore.QPointF(-1000, -1000),
+                                view.transform()) is None
+
+
+def test_connection_move_after_reposition(scene, view, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    node2.position = (200, 50)
+    conn = scene.create_connection(node2[PortType.input][0],
+                                   node1[PortType.output][0])
+    cgo = conn.graphics_object
+
+    def port_scene_pos(node, port_type):
+        return node.geometry.port_scene_position(
+            port_type, 0, node.graphics_object.sceneTransform())
+
+    cgo.move()
+    cgo.setPos(cgo.pos() + qtpy.QtCore.QPointF(30, -40))
+    cgo.move()
+    assert (cgo.mapToScene(conn.geometry.sink) ==
+            port_scene_pos(node2, PortType.input))
+    assert (cgo.mapToScene(conn.geometry.source) ==
+            port_scene_pos(node1, PortType.output))
+
+
+def test_node_state_port_mapping(scene, model):
+    node = scene.create_node(model)
+    for port_type in (PortType.input, PortType.output):
+        ports = node[port_type]
+        assert list(ports.keys()) == list(range(len(ports)))
+        assert [port.index for port in ports.values()] == list(ports.keys())
+    assert list(node.state.ports) == (
+        list(node[PortType.input].values()) +
+        list(node[PortType.output].values()))
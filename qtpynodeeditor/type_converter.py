@@ -1,19 +1,36 @@
-class TypeConverterId:
-    def __init__(self, type_in, type_out):
-        self.type_in = type_in
-        self.type_out = type_out
+from collections import namedtuple
+
+TypeConverterId = namedtuple('TypeConverterId', ('type_in', 'type_out'))
 
 
 class TypeConverter(TypeConverterId):
+    # Converters compare and hash by identity, not by their (in, out) types
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+    def __new__(cls, type_in, type_out, func):
+        return super().__new__(cls, type_in, type_out)
+
     def __init__(self, type_in, type_out, func):
-        self.type_in = type_in
-        self.type_out = type_out
         self.id = TypeConverterId(type_in, type_out)
         self.func = func
 
     def __call__(self, input):
         return self.func(input)
 
+    @property
+    def convert(self):
+        """
+        The callable performing the conversion
+
+        This is `func` itself unless a subclass overrides ``__call__``,
+        which saves a call frame per conversion.
+        """
+        if type(self).__call__ is TypeConverter.__call__:
+            return self.func
+        return self
+
 
 def _convert(arg):
     return arg
@@ -0,0 +1,38 @@
+import functools
+
+
+def jit(func=None, **kwargs):
+    """
+    Compile a numeric kernel with numba, if it is available.
+
+    Intended for the compute-bound inner loops of user-defined
+    :class:`~qtpynodeeditor.NodeDataModel` implementations, such as array
+    transforms called from ``set_in_data`` or ``out_data``.  Compilation is
+    deferred to the first call.  If numba is not installed, `func` is
+    returned unchanged.
+
+    May be used either as ``@jit`` or as ``@jit(**kwargs)``.
+
+    Parameters
+    ----------
+    func : callable, optional
+        The function to compile.
+
+    **kwargs :
+        Passed to ``numba.njit``.  ``cache`` defaults to True.
+
+    Returns
+    -------
+    func : callable
+        The compiled dispatcher, or `func` itself.
+    """
+    if func is None:
+        return functools.partial(jit, **kwargs)
+
+    try:
+        import numba
+    except ImportError:
+        return func
+
+    kwargs.setdefault('cache', True)
+    return numba.njit(**kwargs)(func)